@@ -9,7 +9,11 @@ import sys
 """
 
 # ---- 基本視窗設定 ----
-FPS = 60
+FPS = 60  # 畫面更新上限 (0 = 不限制)
+SIM_TICK_RATE = 60  # 遊戲邏輯固定的更新頻率 (Hz)，與畫面更新率無關
+MAX_CATCHUP_STEPS = 5  # 卡頓時一個畫面最多補跑幾個 tick，超過就讓遊戲變慢而不是越積越多
+SIM_SEED = None  # 遊戲邏輯亂數 (SIM_CLOCK.random，例如掉落) 的種子：None = 每局不同，整數 = 每局結果相同
+SIM_UNCAPPED = False  # True: 不等實際時間，每個畫面直接跑一個 tick (無頭模擬 / 測試，結果只由 tick 數決定)
 WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720
 TITLE = '工   地   血   戰'
 
@@ -100,4 +104,55 @@ MUSIC_VOLUME = 0.5
 MENU_BG_COLOR = (10, 10, 10)
 MENU_TITLE_COLOR = (255, 255, 255)
 MENU_TEXT_COLOR = (200, 200, 200)
-MENU_BG_IMAGE = SKY_FG  # 主選單背景可直接重用前景天空
\ No newline at end of file
+MENU_BG_IMAGE = SKY_FG  # 主選單背景可直接重用前景天空
+
+# --- Health bar (Overlay) ---
+HEALTH_BAR_MODE = 'auto'  # 'auto' | 'icons' | 'segmented' | 'numeric'
+HEALTH_ICON_LIMIT = 30  # auto 模式下，max HP 超過此值改用 segmented
+HEALTH_BAR_SEGMENTS = 10
+HEALTH_BAR_WIDTH = 300  # segmented 血條總寬 (px)
+HEALTH_BAR_COLOR = (220, 40, 40)
+HEALTH_BAR_BG_COLOR = (60, 20, 20)
+
+# --- Parallax layers (由遠到近繪製) ---
+# factor: 相機位移的除數，越大越遠；y: 相機位移為 0 時的螢幕 y
+PARALLAX_LAYERS = [
+    {'image': SKY_BG, 'factor': 2.5, 'y': 850},
+    {'image': SKY_FG, 'factor': 2, 'y': 850},
+]
+
+# ---- 渲染效能 ----
+RENDER_CELL_SIZE = 256  # 畫面裁切用空間索引的格子大小 (px)
+RENDER_CULL_MARGIN = 128  # 視窗外額外保留的繪製範圍 (px)，避免圖片比 rect 大時邊緣被裁掉
+STATIC_CHUNK_SIZE = 512  # 靜態 tile 圖層預先烘焙成 chunk 的邊長 (px)
+TEXT_CACHE_MAX_ENTRIES = 256  # 文字 render 快取筆數上限
+TEXT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # 文字 render 快取記憶體上限 (bytes)
+
+# 內部渲染解析度：世界先畫在這個大小的離屏 surface 再放大到視窗 (例如 640x360 / 960x540)
+# 與視窗相同時直接畫在視窗上；視野範圍不變，只是解析度較低
+RENDER_WIDTH, RENDER_HEIGHT = WINDOW_WIDTH, WINDOW_HEIGHT
+RENDER_SCALE_FILTER = 'nearest'  # 'nearest' | 'smooth'
+HUD_NATIVE_RESOLUTION = True  # HUD 畫在放大後的視窗 (清晰) 或跟世界一起縮放
+SHOW_RENDER_STATS = False  # 右上角顯示渲染成本 (遊戲中按 F3 切換)
+
+# ---- 碰撞效能 ----
+COLLISION_CELL_SIZE = 128  # collision_sprites 空間索引的格子大小 (px)
+
+# ---- 模擬效能 ----
+BULLET_ENGINE = 'sprite'  # 'sprite': 每顆子彈一個 Bullet sprite | 'array': NumPy 陣列批次處理 (大量子彈)
+BULLET_POOL_SIZE = 1024  # 同時存在的 Bullet sprite 上限 (SpritePool，重複使用已消失的子彈)
+SPRITE_POOL_OVERFLOW = 'drop_oldest'  # 池滿時: 'drop_oldest' 提早回收最舊的 | 'refuse' 不再生成
+ENEMY_ACTIVE_MARGIN = 256  # 視窗外這個距離 (px) 以內的敵人完整更新；更遠的休眠 (不動畫、不射擊)
+
+# ---- 粒子特效 (ParticleSystem，存在 ECS World 的 NumPy 欄位，批次模擬與繪製) ----
+PARTICLE_LIMIT = 4000  # 同時存在的粒子上限，超過的爆發會被截掉
+# count: 每次爆發的粒子數 / speed: 初速範圍 (像素/秒) / spread: 發散角度 (度，以射擊方向為中心；360 = 全方向)
+# gravity: y 加速度 (像素/秒^2) / life_ms: 存活時間範圍 / size: 起始邊長 (px，逐幀縮小到 1) / colors: 隨機挑一個
+PARTICLE_EFFECTS = {
+    'hit': {'count': 12, 'speed': (120, 320), 'spread': 360, 'gravity': 900, 'life_ms': (200, 400),
+            'size': 4, 'colors': [(255, 240, 200), (255, 170, 60)]},
+    'death': {'count': 40, 'speed': (150, 450), 'spread': 360, 'gravity': 1200, 'life_ms': (400, 800),
+              'size': 6, 'colors': [(200, 40, 40), (120, 20, 20), (255, 200, 80)]},
+    'muzzle': {'count': 6, 'speed': (200, 400), 'spread': 40, 'gravity': 0, 'life_ms': (80, 160),
+               'size': 3, 'colors': [(255, 230, 120)]},
+}
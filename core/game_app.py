@@ -1,10 +1,15 @@
 import pygame, sys
-from configs.settings import WINDOW_WIDTH, WINDOW_HEIGHT, TITLE, MUSIC_FILE, MUSIC_VOLUME, BULLET_IMG, asset_path
+from configs.settings import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, TITLE, MUSIC_FILE, MUSIC_VOLUME, BULLET_IMG, FPS, SIM_TICK_RATE, MAX_CATCHUP_STEPS,
+    SIM_UNCAPPED, asset_path,
+)
 from model.service.assets import AssetManager
+from model.service.sim_clock import SIM_CLOCK
 from core.scene_manager import SceneManager
 from core.level_manager import LevelManager
 from core.fonts import FontManager, GameFonts
 from core.audio import AudioManager
+from core.renderer import Renderer
 from ui.hud import HUD
 from core.scenes.menu import MenuScene
 from core.scenes.level import LevelScene
@@ -18,7 +23,13 @@ class GameApp:
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
         self.running = True
-        self.dt_last = 0.0
+        self.dt_last = 0.0  # 上一個畫面實際經過的時間 (s)
+        self.sim_dt = 1 / SIM_TICK_RATE
+        self.sim_clock = SIM_CLOCK  # 遊戲邏輯的時間，每個 tick 前進 sim_dt (不是實際經過的時間)
+        self._accumulator = 0.0  # 還沒模擬掉的時間 (s)
+        self._skip_frame_time = False  # 換場景 (載入關卡) 花的時間不拿來補 tick
+        self._timeline_reset = False  # 這個 tick 換了場景 / 關卡，step 不再繼續補 tick
+        self._full_present = True  # 視窗被遮蔽 / 還原後需要整個畫面重新送出
 
         # assets
         self.assets = AssetManager()
@@ -28,6 +39,9 @@ class GameApp:
         # fonts
         self.fonts = GameFonts(FontManager())
 
+        # internal resolution renderer
+        self.renderer = Renderer(self.display, self.fonts)
+
         # surfaces
         self.bullet_surf = self.assets.image(BULLET_IMG)
         self.fire_surfs = [self.assets.image(asset_path('graphics', 'fire', f'{i}.png')) for i in range(0, 2)]
@@ -46,29 +60,83 @@ class GameApp:
 
     def change_scene(self, name: str):
         self.scene_manager.change(name)
+        self.reset_timeline()
+
+    def reset_timeline(self):
+        """換場景 / 載入新關卡之後呼叫: 丟掉還沒模擬的時間，載入花的時間也不拿來補 tick；
+        在 update 中呼叫時，step 跑完這個 tick 就停，不會在新場景上繼續補跑"""
+        self._accumulator = 0.0
+        self._skip_frame_time = True
+        self._timeline_reset = True
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
                 return
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._full_present = True
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.renderer.show_stats = not self.renderer.show_stats
+                # 靜態場景的快取畫面要重新貼一次，蓋掉舊的統計文字
+                if hasattr(self.scene_manager.current, 'invalidate'):
+                    self.scene_manager.current.invalidate()
             if self.scene_manager.current and hasattr(self.scene_manager.current, 'handle_event'):
                 self.scene_manager.current.handle_event(event)
 
     def update(self, dt: float):
         if self.scene_manager.current:
             self.scene_manager.current.update(dt)
+        self.sim_clock.advance(dt)
 
-    def draw(self):
+    def draw(self, alpha: float = 1.0):
+        """alpha: 目前時間落在上一個與最新 tick 之間的比例，用來內插繪製位置"""
+        dirty = None
         if self.scene_manager.current:
-            self.scene_manager.current.draw(self.display)
-        pygame.display.update()
+            dirty = self.renderer.draw(self.scene_manager.current, alpha)
+        # None: 整個畫面；[]: 沒有變化，不送出；[rect, ...]: 只送出變動區域
+        if dirty is None or self._full_present:
+            pygame.display.update()
+            self._full_present = False
+        elif dirty:
+            pygame.display.update(dirty)
+
+    def step(self, frame_dt: float) -> float:
+        """固定步長模擬: 累積實際經過的時間，每滿 sim_dt 跑一次 update(sim_dt)
+
+        回傳內插用的 alpha (0~1)。一個畫面最多跑 MAX_CATCHUP_STEPS 次，
+        超過的部分直接丟掉 (遊戲暫時變慢)，避免卡頓後越補越慢。
+        """
+        if self._skip_frame_time:
+            frame_dt = 0.0
+            self._skip_frame_time = False
+        self._accumulator += frame_dt
+        self._timeline_reset = False
+        steps = 0
+        while self._accumulator >= self.sim_dt and steps < MAX_CATCHUP_STEPS:
+            self.update(self.sim_dt)
+            if self._timeline_reset:
+                break  # reset_timeline 已把 accumulator 歸零
+            self._accumulator -= self.sim_dt
+            steps += 1
+        if steps == MAX_CATCHUP_STEPS and self._accumulator >= self.sim_dt:
+            self._accumulator %= self.sim_dt
+        self._accumulator = max(self._accumulator, 0.0)
+        return self._accumulator / self.sim_dt
 
-    def run(self):
+    def run(self, uncapped: bool = SIM_UNCAPPED):
+        """uncapped: 不限制畫面更新率、不看實際經過的時間，每個畫面固定跑一個 tick
+        (無頭模式下盡可能快地模擬；遊戲時間都來自 sim_clock，所以結果與機器速度無關)"""
         while self.running:
             self.handle_events()
-            self.dt_last = self.clock.tick(60) / 1000
-            self.update(self.dt_last)
-            self.draw()
+            if uncapped:
+                self.clock.tick()
+                self.dt_last = self.sim_dt
+                self.step(self.sim_dt)  # 剛好一個 tick，畫最新的狀態
+                alpha = 1.0
+            else:
+                self.dt_last = self.clock.tick(FPS) / 1000
+                alpha = self.step(self.dt_last)
+            self.draw(alpha)
         pygame.quit()
         sys.exit()
@@ -1,9 +1,14 @@
 import os
 import pygame
-from configs.settings import LEVEL_MAPS, MAIN_MAP
+from configs.settings import LEVEL_MAPS, MAIN_MAP, COLLISION_CELL_SIZE, RENDER_CELL_SIZE
 from model.service.camera import AllSprites
 from model.entity.overlay import Overlay
+from model.ecs.bridge import SpriteBridge
+from model.ecs.systems import default_systems
+from model.ecs.world import World
 from model.factory.tmx_entities import TMXEntityFactory
+from model.service.spatial_index import SpatialGroup
+from model.service.tile_grid import TileGrid
 
 class LevelManager:
     def __init__(self, assets, level_thresholds: dict[int, int]):
@@ -13,15 +18,20 @@ class LevelManager:
         self.current_level = 1
         self.player = None
         self.platform_border_rects: list[pygame.Rect] = []
+        self.tile_grid: TileGrid | None = None  # 'Level' 層的格子佔用表 (靜態地形)
         self.overlay = None
 
         # sprite groups
         self.all_sprites: AllSprites | None = None
-        self.collision_sprites = pygame.sprite.Group()
+        # ECS 實體 (元件以 NumPy 欄位批次處理)，透過 SpriteBridge 畫在 all_sprites 的各層中
+        self.world: World | None = None
+        self.collision_sprites = SpatialGroup(COLLISION_CELL_SIZE)  # 以 query(rect) 取附近的碰撞物
         self.platform_sprites = pygame.sprite.Group()
         self.bullet_sprites = pygame.sprite.Group()
         self.vulnerable_sprites = pygame.sprite.Group()
         self.item_sprites = pygame.sprite.Group()  # 道具群組 (掉落 + 撿取)
+        # 敵人 (以 query 找出鏡頭 / 平台 / 子彈附近的)；敵人自己不會移動，被平台載著時由 carry() 通知
+        self.enemy_sprites = SpatialGroup(RENDER_CELL_SIZE, dynamic=False)
 
         # factory & callbacks
         self.factory: TMXEntityFactory | None = None
@@ -37,8 +47,10 @@ class LevelManager:
         if not os.path.exists(map_path):
             map_path = MAIN_MAP
 
-        tmx_map = self.assets.tmx(map_path)
-        self.all_sprites = AllSprites(self.assets, tmx_map)
+        self.all_sprites = AllSprites(self.assets)
+        self.world = World()
+        self.world.systems = default_systems()
+        SpriteBridge(self.world, self.all_sprites)
 
         # reset groups (all_sprites 由 AllSprites 重新建立)
         self.collision_sprites.empty()
@@ -46,6 +58,7 @@ class LevelManager:
         self.bullet_sprites.empty()
         self.vulnerable_sprites.empty()
         self.item_sprites.empty()
+        self.enemy_sprites.empty()
 
         # factory
         self.factory = TMXEntityFactory(
@@ -54,10 +67,13 @@ class LevelManager:
             collision_sprites=self.collision_sprites,
             platform_sprites=self.platform_sprites,
             vulnerable_sprites=self.vulnerable_sprites,
-            shoot_cb=self._shoot_cb
+            enemy_sprites=self.enemy_sprites,
+            shoot_cb=self._shoot_cb,
+            world=self.world
         )
 
         self.player, self.platform_border_rects = self.factory.build_world(map_path)
+        self.tile_grid = self.factory.tile_grid
 
         if self.player:
             self.player.item_sprites = self.item_sprites
@@ -67,6 +83,8 @@ class LevelManager:
             if not hasattr(self.player, 'assets'):
                 self.player.assets = self.assets
 
+        if self.overlay:
+            self.overlay.close()
         self.overlay = Overlay(self.player)
 
     def inject_shoot(self, shoot_cb):
@@ -0,0 +1,95 @@
+import time
+
+import pygame
+from configs.settings import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, RENDER_WIDTH, RENDER_HEIGHT, RENDER_SCALE_FILTER, HUD_NATIVE_RESOLUTION,
+    SHOW_RENDER_STATS,
+)
+
+
+class Renderer:
+    """Draws scenes at the internal render resolution and scales the result to the window.
+
+    - RENDER_WIDTH x RENDER_HEIGHT 與視窗相同時直接畫在 display 上 (沒有額外成本)
+    - 否則世界畫在離屏 surface，再以 RENDER_SCALE_FILTER ('nearest' / 'smooth') 放大到視窗
+    - 場景的 draw_hud() 依 HUD_NATIVE_RESOLUTION 畫在放大後的視窗 (清晰) 或內部解析度上
+    - native_resolution = True 的場景 (例如有快取的靜態場景) 永遠直接畫在 display
+
+    自身成本記錄在 frame_ms / scale_ms (指數移動平均)，F3 或 SHOW_RENDER_STATS 會顯示在右上角，
+    下方接著場景的 debug_stats() (例如關卡的物件池使用量)。
+    """
+    def __init__(self, display: pygame.Surface, fonts):
+        self.display = display
+        self.fonts = fonts
+        self.size = (RENDER_WIDTH, RENDER_HEIGHT)
+        self.native = self.size == display.get_size()
+        self.world = display if self.native else pygame.Surface(self.size).convert()
+        self.smooth = RENDER_SCALE_FILTER == 'smooth'
+        self.show_stats = SHOW_RENDER_STATS
+
+        # stats (ms, EMA)
+        self.frame_ms = 0.0
+        self.scale_ms = 0.0
+
+    def _upscale(self):
+        size = self.display.get_size()
+        if self.smooth:
+            pygame.transform.smoothscale(self.world, size, self.display)
+        else:
+            pygame.transform.scale(self.world, size, self.display)
+
+    def _to_window(self, rect: pygame.Rect) -> pygame.Rect:
+        sx = WINDOW_WIDTH / RENDER_WIDTH
+        sy = WINDOW_HEIGHT / RENDER_HEIGHT
+        return pygame.Rect(int(rect.x * sx), int(rect.y * sy), int(rect.w * sx) + 1, int(rect.h * sy) + 1)
+
+    def draw(self, scene, alpha: float = 1.0):
+        """畫出場景；回傳要送到視窗的 dirty rects (規則同 BaseScene.draw)"""
+        start = time.perf_counter()
+        draw_hud = getattr(scene, 'draw_hud', None)
+        scale_ms = 0.0
+        if self.native or getattr(scene, 'native_resolution', False):
+            dirty = scene.draw(self.display, alpha)
+            if dirty == []:
+                return self._finish(scene, start, scale_ms, dirty)
+            if draw_hud:
+                draw_hud(self.display)
+        else:
+            dirty = scene.draw(self.world, alpha)
+            if dirty == []:
+                return self._finish(scene, start, scale_ms, dirty)
+            if draw_hud and not HUD_NATIVE_RESOLUTION:
+                draw_hud(self.world)
+            scale_start = time.perf_counter()
+            self._upscale()
+            scale_ms = (time.perf_counter() - scale_start) * 1000
+            if draw_hud and HUD_NATIVE_RESOLUTION:
+                draw_hud(self.display)
+            if dirty is not None:
+                dirty = [self._to_window(rect) for rect in dirty]
+        return self._finish(scene, start, scale_ms, dirty)
+
+    def _finish(self, scene, start: float, scale_ms: float, dirty):
+        if dirty == [] and not self.show_stats:
+            return dirty
+        self.frame_ms += ((time.perf_counter() - start) * 1000 - self.frame_ms) * 0.1
+        self.scale_ms += (scale_ms - self.scale_ms) * 0.1
+        if self.show_stats:
+            self._draw_stats(scene)
+            return None
+        return dirty
+
+    def _draw_stats(self, scene):
+        w, h = self.size
+        mode = 'smooth' if self.smooth else 'nearest'
+        lines = [f'{w}x{h} {mode}  render {self.frame_ms:.2f} ms  scale {self.scale_ms:.2f} ms']
+        debug_stats = getattr(scene, 'debug_stats', None)
+        if debug_stats:
+            lines.extend(debug_stats())
+        top = 10
+        for text in lines:
+            surf = self.fonts.text.render(text, True, (255, 255, 0))  # 每幀都不同，不放進 TEXT_CACHE
+            rect = surf.get_rect(topright=(self.display.get_width() - 10, top))
+            self.display.fill((0, 0, 0), rect.inflate(8, 4))
+            self.display.blit(surf, rect)
+            top = rect.bottom + 4
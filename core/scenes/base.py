@@ -1,4 +1,21 @@
+import pygame
+
+
 class BaseScene:
+    """Scene interface.
+
+    draw(surface) may return the dirty rects it changed:
+    - None: the whole surface may have changed (GameApp presents the full window)
+    - []: nothing changed, nothing is presented
+    - [rect, ...]: only these regions are presented
+
+    draw() renders at the internal render resolution; draw_hud() is called afterwards with the
+    surface the HUD belongs on (see core.renderer.Renderer).
+    alpha is how far the frame lies between the previous and the latest fixed simulation tick
+    (0~1, see GameApp.step); scenes with moving sprites draw them interpolated by it.
+    """
+    native_resolution = False  # True: 一律直接畫在視窗上，不經過內部解析度縮放
+
     def __init__(self, app):
         self.app = app
     def enter(self):
@@ -9,5 +26,48 @@ class BaseScene:
         pass
     def update(self, dt: float):
         pass
-    def draw(self, surface):
+    def draw(self, surface, alpha: float = 1.0):
         pass
+    def draw_hud(self, surface):
+        pass
+    def debug_stats(self) -> list[str]:
+        """額外顯示在 F3 統計 (Renderer.show_stats) 下方的文字，每個元素一行"""
+        return []
+
+
+class StaticScene(BaseScene):
+    """Scene whose picture does not change on its own (menu, credits...).
+
+    The frame is composed once by compose() and cached; draw() only blits it the first time after
+    enter() (or invalidate()), and reports no dirty rects afterwards, so idle frames cost nothing.
+    Since the frame is cached anyway it is composed at native window resolution.
+    """
+    native_resolution = True
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._frame: pygame.Surface | None = None
+        self._presented = False
+
+    def enter(self):
+        # 其他場景可能已經畫過整個畫面，重新進入時要再貼一次
+        self._presented = False
+
+    def invalidate(self):
+        """畫面內容改變時呼叫，下一次 draw 會重新 compose"""
+        self._frame = None
+        self._presented = False
+
+    def compose(self, surface):
+        pass
+
+    def draw(self, surface, alpha: float = 1.0):
+        if self._frame is None or self._frame.get_size() != surface.get_size():
+            self._frame = pygame.Surface(surface.get_size()).convert()
+            self.compose(self._frame)
+            self._presented = False
+        if self._presented:
+            return []
+        surface.blit(self._frame, (0, 0))
+        self._presented = True
+        return [surface.get_rect()]
@@ -1,9 +1,11 @@
 import pygame
+from core.scenes.base import StaticScene
+from model.service.text_cache import TEXT_CACHE
 from configs.settings import WINDOW_WIDTH, WINDOW_HEIGHT
 
-class CreditsScene:
+class CreditsScene(StaticScene):
     def __init__(self, app):
-        self.app = app
+        super().__init__(app)
         self.lines = [
             "THANK YOU FOR PLAYING",
             "感謝遊玩本遊戲！",
@@ -20,16 +22,13 @@ class CreditsScene:
         if event.type == pygame.KEYDOWN:
             self.app.change_scene('menu')
 
-    def draw(self, surface):
+    def compose(self, surface):
         surface.fill((0, 0, 0))
-        title_surf = self.app.fonts.credits_title.render(self.lines[0], True, (255,255,255))
+        title_surf = TEXT_CACHE.render(self.app.fonts.credits_title, self.lines[0], (255,255,255))
         title_rect = title_surf.get_rect(center=(WINDOW_WIDTH/2, WINDOW_HEIGHT*0.25))
         surface.blit(title_surf, title_rect)
         start_y = title_rect.bottom + 40
         for i, line in enumerate(self.lines[1:]):
-            surf = self.app.fonts.credits_line.render(line, True, (220,220,220))
+            surf = TEXT_CACHE.render(self.app.fonts.credits_line, line, (220,220,220))
             rect = surf.get_rect(center=(WINDOW_WIDTH/2, start_y + i * 50))
             surface.blit(surf, rect)
-
-    def update(self, dt: float):
-        pass
@@ -1,7 +1,13 @@
 import pygame
 from configs.settings import BG_COLOR, BULLET_IMG, asset_path
+from core.systems.activity import ActivitySystem
+from core.systems.carrier import CarrierSystem
 from core.systems.collisions import CollisionSystem
+from core.systems.enemy_ai import EnemyAISystem
+from core.systems.particles import ParticleSystem
 from core.systems.shooting import ShootingSystem
+from model.ecs.systems import FollowSystem
+from model.service.sim_clock import SIM_CLOCK
 
 class LevelScene:
     def __init__(self, app):
@@ -10,26 +16,54 @@ class LevelScene:
         # Systems filled in on enter when assets ready
         self.collision_system: CollisionSystem | None = None
         self.shooting: ShootingSystem | None = None
+        self.carrier: CarrierSystem | None = None
+        self.activity: ActivitySystem | None = None
+        self.enemy_ai: EnemyAISystem | None = None
+        self.particles: ParticleSystem | None = None
+        self.follow = FollowSystem()
 
     def enter(self):
+        self.exit()  # 重新進入時先取消上一次的事件訂閱
+        SIM_CLOCK.reset()  # 每局從模擬時間 0 開始，結果與之前的場景跑了多久無關
         # setup shooting system first so callback exists
         self.shooting = ShootingSystem(self.lm, self.app.bullet_surf, self.app.fire_surfs)
         self.lm.build_level(1, self.shooting.shoot)
         if self.lm.player:
             self.lm.player.kill_count = 0
         self.collision_system = CollisionSystem(self.lm)
+        self.carrier = CarrierSystem(self.lm)
+        self.activity = ActivitySystem(self.lm)
+        self.enemy_ai = EnemyAISystem(self.lm, self.activity)
+        self.particles = ParticleSystem(self.lm)
         self.app.hud.start_level_announce()
 
+    def exit(self):
+        if self.particles is not None:
+            self.particles.close()
+            self.particles = None
+
     def update(self, dt: float):
         player = self.lm.player
         if not player:
             return
         if self.collision_system:
             self.collision_system.platform_collisions()
+        if self.activity:
+            self.activity.update(dt)  # 決定這個 tick 哪些敵人完整更新
+        if self.shooting:
+            self.shooting.update(dt)
+        if self.lm.world is not None:
+            self.lm.world.step(dt)  # ECS 實體 (這個 tick 才建立的下個 tick 才開始動，與 sprite 相同)
         if self.lm.all_sprites:
             self.lm.all_sprites.update(dt)
+        if self.enemy_ai:
+            self.enemy_ai.update()  # 所有敵人一次決定朝向 / 開火
+        if self.carrier:
+            self.carrier.update()  # 平台移動完才載運站在上面的角色 / 道具
+        if self.lm.world is not None:
+            self.follow.update(self.lm.world)  # 跟著角色的 ECS 實體 (槍口火焰) 對齊角色最後的位置
         if self.collision_system:
-            self.collision_system.bullet_collisions()
+            self.collision_system.bullet_collisions(self.shooting.engine if self.shooting else None)
 
         # level progression
         if self.lm.needs_advance():
@@ -40,6 +74,7 @@ class LevelScene:
                 if self.lm.player:
                     self.lm.player.kill_count = preserved
                 self.app.hud.start_level_announce()
+                self.app.reset_timeline()  # 與換場景相同: 載入時間不補 tick，也不在新關卡上補跑
             else:
                 self.app.change_scene('credits')
 
@@ -47,12 +82,22 @@ class LevelScene:
         if player.health <= 0 or not player.alive():
             self.app.change_scene('menu')
 
-    def draw(self, surface):
+    def draw(self, surface, alpha: float = 1.0):
         surface.fill(BG_COLOR)
         if self.lm.all_sprites:
-            self.lm.all_sprites.render(self.lm.player)
+            self.lm.all_sprites.render(self.lm.player, surface, alpha)
+
+    def debug_stats(self) -> list[str]:
+        if not self.shooting:
+            return []
+        return [
+            f"{name} pool {s['live']}/{s['capacity']} live  hits {s['hits']} misses {s['misses']} dropped {s['dropped']}"
+            for name, s in self.shooting.pool_stats().items()
+        ]
+
+    def draw_hud(self, surface):
         if self.lm.overlay:
-            self.lm.overlay.display()
+            self.lm.overlay.display(surface)
         self.app.hud.draw_kill_count(surface, self.lm.current_level, self.lm.player)
         # level announce uses last dt stored in app
         self.app.hud.draw_level_announce(surface, self.lm.current_level, self.app.dt_last)
@@ -0,0 +1,51 @@
+import pygame
+
+from configs.settings import WINDOW_WIDTH, WINDOW_HEIGHT, ENEMY_ACTIVE_MARGIN
+
+
+class ActivitySystem:
+    """敵人模擬 LOD: 鏡頭 (以玩家為中心的視窗) 外 ENEMY_ACTIVE_MARGIN 以內的敵人完整更新，
+    更遠的休眠 (AllSprites 不再 update)，重新進入範圍時補上動畫相位並恢復。
+
+    每個 tick 在 all_sprites.update 之前跑一次；只查詢 enemy_sprites 空間索引中範圍附近的敵人，
+    地圖上放多少敵人，成本都只跟範圍內 / 剛離開的數量有關。
+    敵人射程 (enemies.json range_px，預設 600 px) 小於半個視窗寬加 margin，所以休眠的敵人本來就不會開火；
+    範圍內的行為完全不變。
+    """
+    def __init__(self, level_manager, margin: int = ENEMY_ACTIVE_MARGIN):
+        self.lm = level_manager
+        self.region = pygame.Rect(0, 0, WINDOW_WIDTH + 2 * margin, WINDOW_HEIGHT + 2 * margin)
+        self.tick = 0
+        self._world = None  # 目前關卡的 all_sprites；換關卡時重設狀態
+        self._active: set = set()
+        self.awake: list = []  # 這個 tick 完整更新的敵人 (依加入群組的順序)，給 EnemyAISystem 用
+        self._since: dict = {}  # 休眠中的敵人 -> 開始休眠的 tick
+
+    def _reset(self):
+        self._world = self.lm.all_sprites
+        # 新關卡的敵人一開始都是 active，讓第一次 update 把範圍外的轉成休眠
+        self._active = set(self.lm.enemy_sprites)
+        self._since = {}
+        self.awake = []
+
+    def update(self, dt: float):
+        player = self.lm.player
+        if not player:
+            return
+        if self._world is not self.lm.all_sprites:
+            self._reset()
+        self.tick += 1
+        self.region.center = player.rect.center
+        self.awake = self.lm.enemy_sprites.query(self.region)
+        nearby = set(self.awake)
+
+        for enemy in nearby - self._active:
+            enemy.activate(self.tick - self._since.pop(enemy, self.tick), dt)
+        for enemy in self._active - nearby:
+            if enemy.alive():
+                enemy.deactivate()
+                self._since[enemy] = self.tick
+        self._active = nearby
+        if len(self._since) > len(self.lm.enemy_sprites):
+            # 清掉休眠中死掉的敵人
+            self._since = {enemy: tick for enemy, tick in self._since.items() if enemy.alive()}
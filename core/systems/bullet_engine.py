@@ -0,0 +1,132 @@
+import numpy as np
+import pygame
+
+from configs.settings import LAYERS
+from model.service.sim_clock import SIM_CLOCK
+
+
+class BulletEngine:
+    """Struct-of-arrays projectiles (BULLET_ENGINE = 'array').
+
+    每顆子彈只是陣列中的一列 (位置、速度、發射時間、發射者、朝向)，不是 Sprite：
+    - step(dt): 一次向量化移動全部子彈並移除超過射程時間的 (與 Bullet.update 相同的浮點運算)
+    - 碰撞由 CollisionSystem.bullet_collisions(engine) 批次處理 (bounds() / masks / keep())
+    - 繪製透過 AllSprites 的 render hook，在 'Level' 層用 Surface.blits 一次畫完
+    陣列容量不夠時加倍，移除子彈時保持發射順序 (命中 / 受傷順序與 sprite 版相同)。
+    """
+    _FIELDS = {
+        'px': np.float64, 'py': np.float64,  # 中心 (浮點)
+        'vx': np.float64, 'vy': np.float64,  # 速度 (像素/秒)
+        'cx': np.int64, 'cy': np.int64,  # 中心 (整數，等同 rect.center)
+        'pcx': np.int64, 'pcy': np.int64,  # 上一個 tick 的 cx / cy (畫面內插用)
+        'born': np.int64,  # 發射時間 (ms)
+        'owner': np.int64,  # 發射者 id()
+        'facing': np.int8,  # 1 右 / -1 左
+    }
+
+    def __init__(self, level_manager, images: dict, speed: float = 600, lifetime: int = 1000, capacity: int = 256):
+        self.lm = level_manager
+        self.images = images  # facing -> (surface, mask)，兩個方向同尺寸
+        self.masks = {facing: mask for facing, (_, mask) in images.items()}
+        self.width, self.height = images[1][0].get_size()
+        self.speed = speed
+        self.lifetime = lifetime
+        self.count = 0
+        self._capacity = 0
+        self._world = None  # 目前掛 render hook 的 AllSprites (換關卡時重來)
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, capacity: int):
+        for name, dtype in self._FIELDS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if self._capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self._capacity = capacity
+
+    def _bind(self):
+        world = self.lm.all_sprites
+        if world is not self._world:
+            self._world = world
+            self.count = 0
+            if world is not None:
+                world.add_render_hook(LAYERS['Level'], self.draw)
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, position, direction, owner=None):
+        self._bind()
+        if self.count == self._capacity:
+            self._grow(self._capacity * 2)
+        rect = pygame.Rect(0, 0, self.width, self.height)
+        rect.center = position  # 與 image.get_rect(center=position) 相同
+        i = self.count
+        self.px[i], self.py[i] = rect.center
+        self.vx[i], self.vy[i] = direction * self.speed
+        self.cx[i] = self.pcx[i] = rect.centerx
+        self.cy[i] = self.pcy[i] = rect.centery
+        self.born[i] = SIM_CLOCK.ticks
+        self.owner[i] = id(owner)
+        self.facing[i] = -1 if direction.x < 0 else 1
+        self.count = i + 1
+
+    def step(self, dt: float):
+        self._bind()
+        n = self.count
+        if not n:
+            return
+        self.pcx[:n] = self.cx[:n]
+        self.pcy[:n] = self.cy[:n]
+        px, py = self.px[:n], self.py[:n]
+        px += self.vx[:n] * dt
+        py += self.vy[:n] * dt
+        self.cx[:n] = np.rint(px)
+        self.cy[:n] = np.rint(py)
+        # 子彈射程 (存在時間限制)
+        alive = SIM_CLOCK.ticks - self.born[:n] <= self.lifetime
+        if not alive.all():
+            self.keep(alive)
+
+    def bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """目前子彈 rect 的 (left, top) 陣列；寬高為 width / height"""
+        n = self.count
+        return self.cx[:n] - self.width // 2, self.cy[:n] - self.height // 2
+
+    def keep(self, alive: np.ndarray):
+        """只留下 alive 為 True 的子彈 (保持原本順序)"""
+        n = self.count
+        k = int(np.count_nonzero(alive))
+        for name in self._FIELDS:
+            array = getattr(self, name)
+            array[:k] = array[:n][alive]
+        self.count = k
+
+    def draw(self, surface: pygame.Surface, offset: tuple[int, int], view: pygame.Rect, alpha: float):
+        """AllSprites render hook: 裁掉畫面外的子彈，每個方向一次 blits"""
+        n = self.count
+        if not n:
+            return
+        x, y = self.bounds()
+        if alpha < 1.0:
+            back = 1.0 - alpha
+            x = x + np.rint((self.pcx[:n] - self.cx[:n]) * back).astype(np.int64)
+            y = y + np.rint((self.pcy[:n] - self.cy[:n]) * back).astype(np.int64)
+        visible = (x < view.right) & (x + self.width > view.left) & (y < view.bottom) & (y + self.height > view.top)
+        ox, oy = offset
+        world = self._world
+        scale = world.scale
+        for facing, (image, _) in self.images.items():
+            chosen = visible & (self.facing[:n] == facing)
+            if not chosen.any():
+                continue
+            sx = x[chosen] - ox
+            sy = y[chosen] - oy
+            if scale != 1:
+                image = world.scaled_image(image)
+                sx = (sx * scale).astype(np.int64)
+                sy = (sy * scale).astype(np.int64)
+            surface.blits([(image, position) for position in zip(sx.tolist(), sy.tolist())], doreturn=False)
@@ -0,0 +1,67 @@
+import pygame
+
+from model.service.spatial_index import sweep_and_prune
+
+
+class CarrierSystem:
+    """移動平台載運: 每個 tick 在平台移動之後跑一次
+
+    站在平台上的玩家、敵人、道具 (rider) 會貼齊平台的新位置並跟著水平位移。
+    「站在上面」= 與平台水平重疊、沒有往上移動，且腳底落在平台這個 tick 經過的上緣範圍內
+    (上個 tick 結束時、碰到邊界反彈後、移動後的位置，往上多留 contact 像素)；
+    rider 在平台之前或之後 update、平台中途被邊界修正位置，都一樣判斷得到。
+    敵人只從 enemy_sprites 空間索引取平台附近的，配對用 x 軸 sweep-and-prune，
+    地圖上有多少敵人都不影響成本。
+    rider 需要有 carry(dx, dy)；上個 tick 還站在平台上、這個 tick 沒被載到 (平台移走了) 的 rider
+    若有 wake() 會被叫醒 (睡著的道具重新受重力影響)。
+    """
+    contact = 5  # 與 Player.check_contact 的偵測高度相同
+
+    def __init__(self, level_manager):
+        self.lm = level_manager
+        self._tops: dict = {}  # platform -> 上個 tick 結束時的上緣 y
+        self._riding: set = set()  # 上個 tick 被載運的 rider
+
+    def _riders(self, platforms):
+        player = self.lm.player
+        if player and player.alive():
+            yield player
+        enemies = self.lm.enemy_sprites
+        seen = set()
+        for platform in platforms:
+            old, new = platform.old_rect, platform.rect
+            top = min(self._tops.get(platform, old.top), old.top, new.top) - self.contact - 1
+            bottom = max(self._tops.get(platform, old.top), old.top, new.top) + 1
+            area = pygame.Rect(min(old.left, new.left), top, max(old.right, new.right) - min(old.left, new.left), bottom - top)
+            for enemy in enemies.query(area):
+                if enemy not in seen:
+                    seen.add(enemy)
+                    yield enemy
+        yield from self.lm.item_sprites
+
+    def update(self):
+        platforms = self.lm.platform_sprites.sprites()
+        if not platforms:
+            self._riding = set()
+            return
+        riders = ((rider, rider.rect) for rider in self._riders(platforms) if hasattr(rider, 'carry'))
+        pairs = sweep_and_prune(riders, ((platform, platform.rect) for platform in platforms))
+
+        carried = set()
+        for rider, platform in pairs:
+            if rider in carried:
+                continue
+            direction = getattr(rider, 'direction', None)
+            if direction is not None and direction.y < 0:
+                continue  # 正在往上跳
+            old, new = platform.old_rect, platform.rect
+            last = self._tops.get(platform, old.top)
+            bottom = rider.rect.bottom
+            if min(last, old.top, new.top) - self.contact <= bottom <= max(last, old.top, new.top):
+                rider.carry(new.x - old.x, new.top - bottom)
+                carried.add(rider)
+        self._tops = {platform: platform.rect.top for platform in platforms}
+        for rider in self._riding - carried:
+            if rider.alive() and hasattr(rider, 'wake'):
+                rider.wake()
+        self._riding = carried
@@ -1,5 +1,8 @@
+import numpy as np
 import pygame
 
+from model.service.spatial_index import sweep_and_prune
+
 class CollisionSystem:
     def __init__(self, level_manager):
         self.lm = level_manager
@@ -9,26 +12,142 @@ class CollisionSystem:
         if not player:
             return
         for platform in self.lm.platform_sprites.sprites():
-            for border in self.lm.platform_border_rects:
-                if platform.rect.colliderect(border):
-                    if platform.direction.y < 0:
-                        platform.rect.top = border.bottom
-                        platform.position.y = platform.rect.y
-                        platform.direction.y = 1
-                    else:
-                        platform.rect.bottom = border.top
-                        platform.position.y = platform.rect.y
-                        platform.direction.y = -1
+            # 路徑上的邊界在建關卡時已算成上下限 (MovingPlatform.set_travel_limits)
+            top, bottom = platform.top_limit, platform.bottom_limit
+            if top is not None and platform.rect.top < top:
+                platform.rect.top = top
+                platform.position.y = platform.rect.y
+                platform.direction.y = 1
+            elif bottom is not None and platform.rect.bottom > bottom:
+                platform.rect.bottom = bottom
+                platform.position.y = platform.rect.y
+                platform.direction.y = -1
             if platform.rect.colliderect(player.rect) and player.rect.centery > platform.rect.centery:
                 platform.rect.bottom = player.rect.top
                 platform.position.y = platform.rect.y
                 platform.direction.y = -1
 
-    def bullet_collisions(self):
-        pygame.sprite.groupcollide(self.lm.bullet_sprites, self.lm.collision_sprites, True, False)
-        hits = pygame.sprite.groupcollide(
-            self.lm.bullet_sprites, self.lm.vulnerable_sprites, True, False, collided=pygame.sprite.collide_mask
+    @staticmethod
+    def _mask_box(sprite) -> pygame.Rect:
+        # collide_mask 以 rect.topleft 為原點、mask 大小為範圍比對，粗篩用同一個範圍才不會漏掉
+        mask = sprite.mask
+        return pygame.Rect(sprite.rect.topleft, mask.get_size())
+
+    def _targets_near(self, area: pygame.Rect) -> list:
+        """area 內可能被打到的目標，依 vulnerable_sprites 的群組順序 (玩家最先加入)"""
+        vulnerable = self.lm.vulnerable_sprites
+        player = self.lm.player
+        targets = [player] if player is not None and player in vulnerable else []
+        targets.extend(enemy for enemy in self.lm.enemy_sprites.query(area) if enemy in vulnerable)
+        return targets
+
+    def _blocked(self, bullets) -> list:
+        """碰到地形 (靜態格子或移動平台) 的子彈"""
+        grid = self.lm.tile_grid
+        if grid is None:
+            return self.lm.collision_sprites.overlapping(bullets)
+        bounds = np.array([(b.rect.left, b.rect.top, b.rect.right, b.rect.bottom) for b in bullets]).T
+        hit = grid.overlaps(*bounds)
+        platforms = [platform.rect for platform in self.lm.platform_sprites]
+        return [bullet for bullet, solid in zip(bullets, hit.tolist()) if solid or bullet.rect.collidelist(platforms) != -1]
+
+    def _engine_collisions(self, engine):
+        """bullet_collisions 的陣列版: 地形用 tile_grid 批次測試；目標則把子彈依 left 排序，
+        每個目標用 searchsorted 取出 x 範圍重疊的那一段，再做 y 測試與 mask 測試"""
+        n = engine.count
+        if not n:
+            return
+        width, height = engine.width, engine.height
+        left, top = engine.bounds()
+        right, bottom = left + width, top + height
+        grid = self.lm.tile_grid
+        if grid is not None:
+            blocked = grid.overlaps(left, top, right, bottom)
+        else:
+            query = self.lm.collision_sprites.query
+            blocked = np.array([bool(query(pygame.Rect(x, y, width, height))) for x, y in zip(left.tolist(), top.tolist())])
+        for platform in self.lm.platform_sprites:
+            rect = platform.rect
+            blocked |= (left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top)
+        alive = ~blocked
+
+        flying = np.flatnonzero(alive)
+        hits = []
+        if flying.size:
+            x0, y0 = int(left[flying].min()), int(top[flying].min())
+            area = pygame.Rect(x0, y0, int(right[flying].max()) - x0, int(bottom[flying].max()) - y0)
+            order = flying[np.argsort(left[flying], kind='stable')]
+            lefts = left[order]
+            for rank, target in enumerate(self._targets_near(area)):
+                box = self._mask_box(target)
+                lo = np.searchsorted(lefts, box.left - width, 'right')  # right > box.left
+                hi = np.searchsorted(lefts, box.right, 'left')  # left < box.right
+                near = order[lo:hi]
+                near = near[(top[near] < box.bottom) & (bottom[near] > box.top)]
+                for i in near.tolist():
+                    mask = engine.masks[int(engine.facing[i])]
+                    if mask.overlap(target.mask, (box.x - int(left[i]), box.y - int(top[i]))):
+                        hits.append((i, rank, target))
+        # 依發射順序、再依群組順序處理 (與 sprite 版相同的受傷順序)
+        hits.sort(key=lambda hit: hit[:2])
+        for i, _, target in hits:
+            alive[i] = False
+            target.damage()
+        if not alive.all():
+            engine.keep(alive)
+
+    def bullet_collisions(self, engine=None):
+        """子彈 vs 地形 / 可受傷目標 (engine: BULLET_ENGINE = 'array' 時的 BulletEngine)
+
+        - 地形: 靜態地形一次向量化查 tile_grid，移動平台另外測 (碰到即消失)；沒有 tile_grid 時查 collision_sprites
+        - 目標: 只取子彈範圍內的敵人 (enemy_sprites 空間索引) + 玩家，x 軸 sweep-and-prune 產生候選配對 → rect 測試 → 最後才做 mask 測試
+        結果與原本兩次 groupcollide 相同: 命中的子彈消失，同一顆子彈可同時傷到多個目標。
+        """
+        if engine is not None:
+            self._engine_collisions(engine)
+        bullets = self.lm.bullet_sprites.sprites()
+        if not bullets:
+            return
+        blocked = self._blocked(bullets)
+        for bullet in blocked:
+            bullet.kill()
+        if blocked:
+            blocked = set(blocked)
+            bullets = [bullet for bullet in bullets if bullet not in blocked]
+        alive = bullets
+
+        if not alive:
+            return
+        boxes = {sprite: self._mask_box(sprite) for sprite in alive}
+        area = None
+        for box in boxes.values():
+            area = box.copy() if area is None else area.union(box)
+        targets = self._targets_near(area)
+        if not targets:
+            return
+        boxes.update((sprite, self._mask_box(sprite)) for sprite in targets)
+        candidates = sweep_and_prune(
+            ((bullet, boxes[bullet]) for bullet in alive),
+            ((target, boxes[target]) for target in targets),
         )
-        for _, targets in hits.items():
-            for target in targets:
-                target.damage()
+
+        hits: dict = {}
+        for bullet, target in candidates:
+            bullet_box = boxes[bullet]
+            target_box = boxes[target]
+            if not bullet_box.colliderect(target_box):
+                continue
+            offset = (target_box.x - bullet_box.x, target_box.y - bullet_box.y)
+            if bullet.mask.overlap(target.mask, offset):
+                hits.setdefault(bullet, []).append(target)
+        if not hits:
+            return
+
+        # 依群組順序處理 (與 groupcollide 相同的命中 / 受傷順序)
+        target_order = {target: i for i, target in enumerate(targets)}
+        for bullet in alive:
+            struck = hits.get(bullet)
+            if struck:
+                bullet.kill()
+                for target in sorted(struck, key=target_order.__getitem__):
+                    target.damage()
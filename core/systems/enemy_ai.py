@@ -0,0 +1,47 @@
+from itertools import chain
+
+import numpy as np
+
+
+class EnemyAISystem:
+    """敵人朝向與開火判斷，每個 tick 對所有完整更新中的敵人 (ActivitySystem.awake) 一次向量化算完。
+
+    每個敵人的參數 (enemies.json 的 range_px / aim_band_px，與 shoot_timer 維護的 can_shoot)
+    和位置一起收進陣列，距離 / 朝向 / 能否開火都是一次 NumPy 運算，只對符合條件的敵人呼叫 fire()。
+    判斷條件 (前三項與原本逐一呼叫的 get_status / check_fire 相同):
+    - 朝向: 玩家中心 x 在敵人中心左邊 → 'left'，否則 'right'
+    - 開火: 中心距離 < range_px、玩家中心 y 在 (top - aim_band, bottom + aim_band) 內、冷卻結束，
+      且子彈高度上到玩家之間沒有靜態地形 (tile_grid.line_clear，只對前面條件都成立的少數敵人查)
+
+    在 all_sprites.update 之後、CarrierSystem 之前呼叫，使用的玩家 / 敵人位置與原本在 Enemy.update 中相同；
+    開出的子彈依敵人加入群組的順序建立，下個 tick 才開始移動。
+    """
+    def __init__(self, level_manager, activity):
+        self.lm = level_manager
+        self.activity = activity
+
+    def update(self):
+        player = self.lm.player
+        if not player:
+            return
+        enemies = [enemy for enemy in self.activity.awake if enemy.active and enemy.alive()]
+        if not enemies:
+            return
+        rows = ((*enemy.rect, enemy.fire_range, enemy.aim_band, enemy.can_shoot, enemy.status == 'left') for enemy in enemies)
+        state = np.fromiter(chain.from_iterable(rows), np.float64, len(enemies) * 8).reshape(-1, 8)
+        x, y, w, h, fire_range, band, ready, was_left = state.T
+        cx = x + w // 2  # 與 rect.center 相同 (整數)
+        cy = y + h // 2
+        px, py = player.rect.center
+
+        left = px < cx
+        dx, dy = px - cx, py - cy
+        fire = (dx * dx + dy * dy < fire_range * fire_range) & (y - band < py) & (py < y + h + band) & (ready != 0)
+
+        # 只有轉向的敵人需要換圖
+        for i in np.flatnonzero(left != (was_left != 0)).tolist():
+            enemies[i].face('left' if left[i] else 'right')
+        grid = self.lm.tile_grid
+        for i in np.flatnonzero(fire).tolist():
+            if grid is None or grid.line_clear(cx[i], px, cy[i] + enemies[i].MUZZLE_Y):
+                enemies[i].fire()
@@ -0,0 +1,113 @@
+import numpy as np
+import pygame
+
+from configs.settings import LAYERS, PARTICLE_EFFECTS, PARTICLE_LIMIT
+from model.ecs.components import ANIMATION, SPRITE
+from model.service.event_bus import GLOBAL_EVENTS
+
+
+class ParticleSystem:
+    """受傷 / 死亡 / 槍口的粒子爆發 (PARTICLE_EFFECTS)，由 GLOBAL_EVENTS 觸發。
+
+    粒子不是 Sprite，而是 level_manager.world (ECS) 裡的實體: position / velocity / gravity 等 component
+    存在同一個 archetype 的 NumPy 欄位 (綁定 world 時就配置好 limit 列，不再擴充)，
+    由 World.step 的 GravitySystem / MotionSystem / AnimationSystem 一次向量化更新，播完最後一幀 (逐漸縮小的方塊) 就移除；繪製由 SpriteBridge 在 'Level' 層用一次 Surface.blits 完成。
+    一次爆發用 World.spawn_many 批次建立；亂數用自己的 generator，不影響遊戲邏輯的 random。
+
+    Events:
+        'entity_hit'(position, ...)  -> 'hit'
+        'entity_died'(position, ...) -> 'death'
+        'shot_fired'(position, direction, ...) -> 'muzzle'
+    """
+    COMPONENTS = ('position', 'prev_position', 'velocity', 'gravity', 'animation', 'sprite')
+
+    def __init__(self, level_manager, effects: dict = PARTICLE_EFFECTS, limit: int = PARTICLE_LIMIT):
+        self.lm = level_manager
+        self.effects = effects
+        self.limit = limit
+        self.rng = np.random.default_rng()
+        self._world = None
+        self._particles = None  # 預先配置的粒子 archetype
+        self._sheets: dict[str, np.ndarray] = {}  # effect -> 每種顏色在 world.sheets 的索引
+        self._frames: dict[tuple, list] = {}  # (color, size) -> 逐漸縮小的方塊
+        GLOBAL_EVENTS.subscribe('entity_hit', self._on_hit)
+        GLOBAL_EVENTS.subscribe('entity_died', self._on_died)
+        GLOBAL_EVENTS.subscribe('shot_fired', self._on_shot)
+
+    def close(self):
+        GLOBAL_EVENTS.unsubscribe('entity_hit', self._on_hit)
+        GLOBAL_EVENTS.unsubscribe('entity_died', self._on_died)
+        GLOBAL_EVENTS.unsubscribe('shot_fired', self._on_shot)
+
+    def _squares(self, color, size: int) -> list:
+        key = (tuple(color), size)
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = []
+            for side in range(size, 0, -1):
+                frame = pygame.Surface((side, side)).convert()
+                frame.fill(color)
+                frames.append(frame)
+            self._frames[key] = frames
+        return frames
+
+    def _bind(self):
+        # 換關卡時 world 是新的，幀要重新加入它的 sheets
+        world = self.lm.world
+        if world is not self._world:
+            self._world = world
+            self._sheets = {}
+            self._particles = None
+            if world is not None:
+                self._particles = world.reserve(self.limit, *self.COMPONENTS)
+                for name, effect in self.effects.items():
+                    self._sheets[name] = np.array(
+                        [world.add_sheet(self._squares(color, effect['size'])) for color in effect['colors']])
+        return world
+
+    def __len__(self):
+        return len(self._particles) if self._particles is not None and self._world is self.lm.world else 0
+
+    def burst(self, name: str, position, direction=None):
+        """在 position 產生一次 name 特效；direction (x, y) 為發散中心方向 (預設往上)"""
+        world = self._bind()
+        if world is None:
+            return
+        effect = self.effects[name]
+        count = min(effect['count'], self.limit - len(self))
+        if count <= 0:
+            return
+        rng = self.rng
+        heading = np.arctan2(direction[1], direction[0]) if direction is not None else -np.pi / 2
+        spread = np.radians(effect['spread'])
+        angle = heading + rng.uniform(-spread / 2, spread / 2, count)
+        speed = rng.uniform(*effect['speed'], count)
+        life = rng.uniform(*effect['life_ms'], count) / 1000
+
+        frames = effect['size']
+        animation = np.zeros(count, dtype=ANIMATION)
+        animation['rate'] = frames / life  # 最後一幀播完時正好到存活時間
+        animation['count'] = frames
+        sprite = np.zeros(count, dtype=SPRITE)
+        sprite['sheet'] = rng.choice(self._sheets[name], count)
+        sprite['z'] = LAYERS['Level']
+        start = np.tile(np.asarray(position, dtype=np.float64), (count, 1))
+        world.spawn_many(
+            count,
+            position=start,
+            prev_position=start,
+            velocity=np.column_stack((np.cos(angle), np.sin(angle))) * speed[:, None],
+            gravity=effect['gravity'],
+            animation=animation,
+            sprite=sprite,
+        )
+
+    def _on_hit(self, position, **_):
+        self.burst('hit', position)
+
+    def _on_died(self, position=None, **_):
+        if position is not None:
+            self.burst('death', position)
+
+    def _on_shot(self, position, direction, **_):
+        self.burst('muzzle', position, direction)
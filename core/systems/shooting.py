@@ -1,5 +1,9 @@
-from model.entity.bullet import Bullet, FireAnimation
+from configs.settings import BULLET_ENGINE, BULLET_POOL_SIZE, SPRITE_POOL_OVERFLOW, LAYERS
+from core.systems.bullet_engine import BulletEngine
+from model.entity.bullet import Bullet
+from model.service.sprite_pool import SpritePool
 from pygame.math import Vector2 as vector
+from model.service.event_bus import GLOBAL_EVENTS
 import pygame
 
 class ShootingSystem:
@@ -8,8 +12,65 @@ class ShootingSystem:
         self.bullet_surf = bullet_surf
         self.fire_surfs = fire_surfs
 
+        # 依方向 (1: 右, -1: 左) 預先翻轉好 surface / mask，所有子彈與槍口火焰共用
+        assets = level_manager.assets
+        bullet_left = assets.flipped(bullet_surf)
+        self._bullet_images = {
+            1: (bullet_surf, assets.mask(bullet_surf)),
+            -1: (bullet_left, assets.mask(bullet_left)),
+        }
+        self._fire_frames = {
+            1: list(fire_surfs),
+            -1: [assets.flipped(frame) for frame in fire_surfs],
+        }
+        # BULLET_ENGINE = 'array': 子彈存在 NumPy 陣列 (BulletEngine)，不建立 Bullet sprite
+        self.engine = BulletEngine(level_manager, self._bullet_images) if BULLET_ENGINE == 'array' else None
+        # 子彈 sprite 重複使用，不每發都建立新物件
+        self.bullet_pool = SpritePool(Bullet, BULLET_POOL_SIZE, SPRITE_POOL_OVERFLOW)
+        self._world = None
+        # 槍口火焰是 level_manager.world (ECS) 的實體: 跟著射擊者 (FollowSystem)，動畫播完就移除
+        self._ecs = None
+        self._fire_sheets: dict[int, int] = {}  # facing -> world.sheets 索引
+
+    def _bind(self):
+        # 換關卡時群組被清空 (沒有經過 kill)，把這些 sprite 收回池中；火焰的幀加入新的 world
+        if self.lm.all_sprites is not self._world:
+            self._world = self.lm.all_sprites
+            self.bullet_pool.reclaim()
+        if self.lm.world is not self._ecs:
+            self._ecs = self.lm.world
+            self._fire_sheets = {facing: self._ecs.add_sheet(frames) for facing, frames in self._fire_frames.items()}
+
+    def pool_stats(self) -> dict:
+        return {'bullet': self.bullet_pool.stats()}
+
+    def _muzzle_flash(self, entity, facing: int):
+        offset = (60 if facing > 0 else -60, 10 if entity.duck else -16)
+        center = (entity.rect.centerx + offset[0], entity.rect.centery + offset[1])
+        self._ecs.spawn(
+            position=center,
+            prev_position=center,
+            owner=entity,
+            offset=offset,
+            animation=(0.0, 15.0, len(self._fire_frames[facing]), False),  # 15 幀/秒，播完移除
+            sprite=(self._fire_sheets[facing], LAYERS['Level']),
+        )
+
+    def update(self, dt: float):
+        """移動陣列子彈 (sprite 子彈由 all_sprites.update 處理)；在 all_sprites.update 之前呼叫，
+        這個 tick 才發射的子彈與 sprite 版一樣下個 tick 才開始移動"""
+        if self.engine is not None:
+            self.engine.step(dt)
+
     def shoot(self, position: vector, direction: vector, entity: pygame.sprite.Sprite):
-        Bullet(position=position, surface=self.bullet_surf, direction=direction,
-               groups=[self.lm.all_sprites, self.lm.bullet_sprites])
-        FireAnimation(entity=entity, surface_list=self.fire_surfs, direction=direction,
-                      groups=self.lm.all_sprites)
+        self._bind()
+        facing = -1 if direction.x < 0 else 1
+        if self.engine is not None:
+            self.engine.spawn(position, direction, entity)
+        else:
+            surface, mask = self._bullet_images[facing]
+            self.bullet_pool.acquire(position=position, surface=surface, direction=direction,
+                                     groups=[self.lm.all_sprites, self.lm.bullet_sprites], mask=mask)
+        if self._ecs is not None:
+            self._muzzle_flash(entity, facing)
+        GLOBAL_EVENTS.emit('shot_fired', position=position, direction=direction, entity_id=id(entity))
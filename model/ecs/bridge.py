@@ -0,0 +1,85 @@
+from functools import partial
+
+import numpy as np
+
+from configs.settings import LAYERS
+
+# TMX 'Entities' 物件名稱 -> spawn(world, obj) -> entity id
+# TMXEntityFactory 遇到登錄過的名稱就在 level 的 World 建立 ECS 實體，而不是 sprite
+ENTITY_SPAWNERS: dict = {}
+
+
+def register_spawner(name: str):
+    """decorator: 讓地圖上名為 name 的物件由 spawn(world, obj) 建立
+
+    Usage:
+        @register_spawner('Crate')
+        def spawn_crate(world, obj):
+            return world.spawn(position=(obj.x, obj.y), sprite=(sheet, LAYERS['Level']))
+    """
+    def decorate(spawn):
+        ENTITY_SPAWNERS[name] = spawn
+        return spawn
+    return decorate
+
+
+class SpriteBridge:
+    """Draws ECS entities (position + sprite) inside the AllSprites camera group.
+
+    每個 LAYERS z 層註冊一個 AllSprites render hook，該層的 sprite 畫完後，
+    把 'sprite' component 同一層的實體用 Surface.blits 畫上去；有 prev_position 的依 alpha 內插，
+    有 animation 的取目前幀。鏡頭、裁切範圍與 RENDER_WIDTH 縮放都沿用 AllSprites，
+    所以 ECS 實體和既有的 sprite 在同一套畫面順序裡。
+    """
+    def __init__(self, world, all_sprites, layers=None):
+        self.world = world
+        self.all_sprites = all_sprites
+        # world.sheets 的所有幀攤平成一張表 (sheet 只會新增)，幀的索引 / 半寬 / 半高都能向量查表
+        self._sheet_count = 0
+        self._images: list = []
+        self._first = np.zeros(0, dtype=np.int64)  # 每個 sheet 第一幀在表中的索引
+        self._half = np.zeros((0, 2), dtype=np.int64)
+        for z in sorted(set(LAYERS.values() if layers is None else layers)):
+            all_sprites.add_render_hook(z, partial(self.draw, z))
+
+    def _frame_table(self):
+        sheets = self.world.sheets
+        if len(sheets) != self._sheet_count:
+            self._sheet_count = len(sheets)
+            self._images = [image for frames in sheets for image in frames]
+            self._first = np.cumsum([0] + [len(frames) for frames in sheets[:-1]], dtype=np.int64)
+            self._half = np.array([image.get_size() for image in self._images], dtype=np.int64).reshape(-1, 2) >> 1
+        return self._images, self._first, self._half
+
+    def draw(self, z, surface, offset, view, alpha):
+        world = self.world
+        group = self.all_sprites
+        scale = group.scale
+        ox, oy = offset
+        images, first, half = self._frame_table()
+        for archetype in world.query('position', 'sprite'):
+            sprite = archetype.column('sprite')
+            layer = np.flatnonzero(sprite['z'] == z)  # 每層各呼叫一次，先挑出這層的再算位置
+            if not layer.size:
+                continue
+            position = archetype.column('position')[layer]
+            if alpha < 1.0 and 'prev_position' in archetype.names:
+                previous = archetype.column('prev_position')[layer]
+                position = previous + (position - previous) * alpha
+            x, y = np.rint(position).astype(np.int64).T
+            visible = (x >= view.left) & (x < view.right) & (y >= view.top) & (y < view.bottom)
+            chosen = layer[visible]
+            if not chosen.size:
+                continue
+            index = first[sprite['sheet'][chosen]]
+            if 'animation' in archetype.names:
+                index += archetype.column('animation')['frame'][chosen].astype(np.int64)
+            # 與 image.get_rect(center=(x, y)) 相同
+            left = x[visible] - half[index, 0] - ox
+            top = y[visible] - half[index, 1] - oy
+            frames = map(images.__getitem__, index.tolist())
+            if scale != 1:
+                frames = map(group.scaled_image, frames)
+                left = (left * scale).astype(np.int64)
+                top = (top * scale).astype(np.int64)
+            surface.blits(zip(frames, zip(left.tolist(), top.tolist())), doreturn=False)
@@ -0,0 +1,46 @@
+"""Component 定義: 名稱 -> (dtype, 每個實體的形狀)
+
+每個 archetype 為它有的每個 component 配一個 NumPy 欄位 (shape = (容量, *形狀))，
+system 直接對整個欄位做向量運算。
+"""
+import numpy as np
+
+
+ANIMATION = np.dtype([
+    ('frame', np.float64),  # 目前幀 (小數，取整後查表)
+    ('rate', np.float64),  # 幀 / 秒
+    ('count', np.int32),  # 總幀數
+    ('loop', np.bool_),  # False: 播完就移除實體 (例如特效)
+])
+
+LIFETIME = np.dtype([
+    ('born', np.float64),  # 建立時間 (World.time, ms)
+    ('ttl', np.float64),  # 存活時間 (ms)
+])
+
+SPRITE = np.dtype([
+    ('sheet', np.int32),  # World.sheets 的索引 (一組動畫幀)
+    ('z', np.int16),  # 繪製層 (LAYERS)
+])
+
+COMPONENTS: dict[str, tuple] = {
+    'position': (np.float64, (2,)),  # 中心點 (世界座標)
+    'prev_position': (np.float64, (2,)),  # 上一個 tick 的 position (畫面內插)
+    'velocity': (np.float64, (2,)),  # 像素 / 秒
+    'gravity': (np.float64, ()),  # y 方向加速度 (像素 / 秒^2)
+    'max_fall': (np.float64, ()),  # y 速度上限
+    'animation': (ANIMATION, ()),
+    'lifetime': (LIFETIME, ()),
+    'health': (np.int32, ()),
+    'hitbox': (np.int32, (2,)),  # 寬、高 (以 position 為中心)
+    'sprite': (SPRITE, ()),
+    'owner': (object, ()),  # 任意 Python 物件參照 (例如產生它的 sprite)
+    'offset': (np.float64, (2,)),  # 相對 owner.rect.center 的位置 (FollowSystem)
+}
+
+
+def register(name: str, dtype, shape: tuple = ()):
+    """新增 component 種類 (需在第一次 spawn 使用它之前)"""
+    if name in COMPONENTS:
+        raise ValueError(f'component {name!r} already registered')
+    COMPONENTS[name] = (dtype, shape)
@@ -0,0 +1,75 @@
+"""Batch systems: 每個 system 對擁有所需 component 的 archetype 整欄運算，不逐實體呼叫 Python。
+
+World.step(dt) 依 world.systems 的順序呼叫 update(world, dt)。
+"""
+from itertools import chain
+
+import numpy as np
+
+
+class MotionSystem:
+    """position += velocity * dt；先把 position 存進 prev_position (有的話)，給畫面內插用"""
+    def update(self, world, dt: float):
+        for archetype in world.query('position', 'velocity'):
+            position = archetype.column('position')
+            if 'prev_position' in archetype.names:
+                archetype.column('prev_position')[:] = position
+            position += archetype.column('velocity') * dt
+
+
+class GravitySystem:
+    """velocity.y += gravity * dt，並限制在 max_fall 以內 (有的話)；要排在 MotionSystem 之前"""
+    def update(self, world, dt: float):
+        for archetype in world.query('velocity', 'gravity'):
+            vy = archetype.column('velocity')[:, 1]
+            vy += archetype.column('gravity') * dt
+            if 'max_fall' in archetype.names:
+                np.minimum(vy, archetype.column('max_fall'), out=vy)
+
+
+class LifetimeSystem:
+    """移除存在超過 ttl 的實體"""
+    def update(self, world, dt: float):
+        for archetype in world.query('lifetime'):
+            lifetime = archetype.column('lifetime')
+            world.remove(archetype, world.time - lifetime['born'] <= lifetime['ttl'])
+
+
+class AnimationSystem:
+    """frame += rate * dt；loop 的從頭播放，不 loop 的播完就移除"""
+    def update(self, world, dt: float):
+        for archetype in world.query('animation'):
+            animation = archetype.column('animation')
+            frame = animation['frame'] + animation['rate'] * dt
+            done = frame >= animation['count']
+            animation['frame'] = np.where(done & animation['loop'], 0.0, frame)
+            world.remove(archetype, ~(done & ~animation['loop']))
+
+
+class HealthSystem:
+    """移除 health <= 0 的實體"""
+    def update(self, world, dt: float):
+        for archetype in world.query('health'):
+            world.remove(archetype, archetype.column('health') > 0)
+
+
+class FollowSystem:
+    """position = owner.rect.center + offset，跟著 sprite 走的實體 (例如槍口火焰)
+
+    要在 sprite 都移動完之後跑 (LevelScene: 平台載運之後)，所以不放在 default_systems / World.step 裡；
+    有 prev_position 的先存下上一個 tick 的位置，畫面和 owner 一起內插。
+    """
+    def update(self, world, dt: float = 0.0):
+        for archetype in world.query('position', 'owner', 'offset'):
+            owners = archetype.column('owner')
+            centers = np.fromiter(chain.from_iterable(owner.rect.center for owner in owners),
+                                  dtype=np.float64, count=2 * len(owners)).reshape(-1, 2)
+            position = archetype.column('position')
+            if 'prev_position' in archetype.names:
+                archetype.column('prev_position')[:] = position
+            np.add(centers, archetype.column('offset'), out=position)
+
+
+def default_systems() -> list:
+    """一般的更新順序: 重力 → 移動 → 動畫 → 存活時間 → 死亡"""
+    return [GravitySystem(), MotionSystem(), AnimationSystem(), LifetimeSystem(), HealthSystem()]
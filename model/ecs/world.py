@@ -0,0 +1,264 @@
+import numpy as np
+
+from model.ecs.components import COMPONENTS
+from model.service.sim_clock import SIM_CLOCK
+
+
+class Archetype:
+    """同一組 component 的所有實體，每個 component 一個連續的 NumPy 欄位 (struct-of-arrays)。
+
+    column(name) 回傳目前實體數長度的 view，可直接原地運算；移除實體時保持其餘實體的順序。
+    """
+    def __init__(self, names: frozenset, capacity: int = 16):
+        self.names = names
+        self.index = -1  # World 內的編號
+        self.count = 0
+        self.entities = np.zeros(capacity, dtype=np.int64)
+        self._columns: dict[str, np.ndarray] = {}
+        for name in sorted(names):
+            dtype, shape = COMPONENTS[name]
+            self._columns[name] = np.zeros((capacity, *shape), dtype=dtype)
+
+    def __len__(self):
+        return self.count
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name][:self.count]
+
+    def _grow(self, capacity: int | None = None):
+        capacity = capacity or len(self.entities) * 2
+        entities = np.zeros(capacity, dtype=np.int64)
+        entities[:self.count] = self.entities[:self.count]
+        self.entities = entities
+        for name, column in self._columns.items():
+            grown = np.zeros((capacity, *column.shape[1:]), dtype=column.dtype)
+            grown[:self.count] = column[:self.count]
+            self._columns[name] = grown
+
+    def reserve(self, capacity: int):
+        """預先配置至少 capacity 列，之後加入實體不必再重新配置 / 複製欄位"""
+        if capacity > len(self.entities):
+            self._grow(capacity)
+
+    def append(self, eid: int, values: dict) -> int:
+        if self.count == len(self.entities):
+            self._grow()
+        row = self.count
+        self.entities[row] = eid
+        for name, column in self._columns.items():
+            value = values.get(name)
+            column[row] = value if value is not None else np.zeros((), column.dtype)
+        self.count = row + 1
+        return row
+
+    def extend(self, eids: np.ndarray, values: dict):
+        """一次加入多個實體；values 的值可以是每個實體一列的陣列，或套用到全部的單一值"""
+        n = len(eids)
+        if self.count + n > len(self.entities):
+            self._grow(max(len(self.entities) * 2, self.count + n))
+        rows = slice(self.count, self.count + n)
+        self.entities[rows] = eids
+        for name, column in self._columns.items():
+            value = values.get(name)
+            column[rows] = value if value is not None else np.zeros((), column.dtype)
+        self.count += n
+
+    def keep(self, alive: np.ndarray) -> np.ndarray:
+        """只留下 alive 為 True 的實體 (順序不變)；回傳被移除的 entity id"""
+        n = self.count
+        removed = self.entities[:n][~alive]
+        k = n - len(removed)
+        self.entities[:k] = self.entities[:n][alive]
+        for column in self._columns.values():
+            column[:k] = column[:n][alive]
+            if column.dtype == object:
+                column[k:n] = None  # 不要留住已移除實體的參照
+        self.count = k
+        return removed
+
+
+class World:
+    """Entity-component store: 實體依 component 組合 (archetype) 分組存放，system 以 query 批次處理。
+
+    - spawn(**components) 建立實體，回傳 entity id；沒給值的 component 欄位為 0
+      (大量同類實體用 spawn_many(count, **columns))
+    - destroy(eid) 先記下，flush() (step 結束時) 一次從各 archetype 移除
+    - 移除後的 entity id 在 flush() 之後回收重用，持續生成 / 移除 (槍口火光、粒子) 時 id 表不會一直變大
+    - query(*names) 回傳擁有這些 component、且有實體的 archetype
+    - step(dt) 依序執行 systems (各自有 update(world, dt))，最後 flush
+    sheets 存放動畫幀 (list[Surface])，'sprite' component 以索引參照，由 SpriteBridge 繪製。
+
+    Usage:
+        world = World()
+        sheet = world.add_sheet(frames)
+        world.spawn(position=(x, y), velocity=(0, -60), sprite=(sheet, LAYERS['Level']),
+                    lifetime=(world.time, 500))
+        world.systems.append(MotionSystem())
+        world.step(dt)
+    """
+    def __init__(self, clock=None):
+        self._archetypes: dict[frozenset, Archetype] = {}
+        self._by_index: list[Archetype] = []
+        # entity id -> (archetype 編號, 列)；-1 = 不存在。以陣列存放，批次加入 / 移除都是向量運算
+        self._archetype_of = np.full(64, -1, dtype=np.int32)
+        self._row = np.full(64, -1, dtype=np.int64)
+        self._next_id = 0
+        self._count = 0
+        # 可重用的 entity id (stack，與 _row 同長)；這個 step 才移除的 id 先放 _retired，flush 時才回收，
+        # 避免同一個 step 內 destroy() 記下的舊 id 指到剛重用它的新實體
+        self._free = np.empty(64, dtype=np.int64)
+        self._free_count = 0
+        self._retired: list[np.ndarray] = []
+        self._pending_destroy: list[int] = []
+        self.systems: list = []
+        self.sheets: list[list] = []
+        self.clock = SIM_CLOCK if clock is None else clock  # 模擬時間的來源 (SimClock)
+
+    @property
+    def time(self) -> float:
+        """模擬時間 (ms)，取自 clock (預設 SIM_CLOCK，每個 tick 前進 dt)；lifetime 以此為準"""
+        return self.clock.elapsed * 1000
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, eid: int):
+        return 0 <= eid < self._next_id and self._archetype_of[eid] >= 0
+
+    # ---- entities ----
+    def _archetype(self, names: frozenset) -> Archetype:
+        archetype = self._archetypes.get(names)
+        if archetype is None:
+            unknown = names - COMPONENTS.keys()
+            if unknown:
+                raise KeyError(f'unknown components: {sorted(unknown)}')
+            archetype = self._archetypes[names] = Archetype(names)
+            archetype.index = len(self._by_index)
+            self._by_index.append(archetype)
+        return archetype
+
+    def _reserve_ids(self, count: int) -> np.ndarray:
+        """先用回收的 id，不夠才配新的"""
+        reused = min(count, self._free_count)
+        self._free_count -= reused
+        eids = np.empty(count, dtype=np.int64)
+        eids[:reused] = self._free[self._free_count:self._free_count + reused]
+        fresh = count - reused
+        if fresh:
+            eids[reused:] = np.arange(self._next_id, self._next_id + fresh)
+            self._next_id += fresh
+        if self._next_id > len(self._row):
+            size = max(len(self._row) * 2, self._next_id)
+            for name in ('_archetype_of', '_row'):
+                old = getattr(self, name)
+                grown = np.full(size, -1, dtype=old.dtype)
+                grown[:len(old)] = old
+                setattr(self, name, grown)
+            free = np.empty(size, dtype=np.int64)
+            free[:self._free_count] = self._free[:self._free_count]
+            self._free = free
+        self._count += count
+        return eids
+
+    def _recycle_retired(self):
+        if not self._retired:
+            return
+        retired = np.concatenate(self._retired)
+        self._retired.clear()
+        end = self._free_count + len(retired)
+        self._free[self._free_count:end] = retired
+        self._free_count = end
+
+    def reserve(self, capacity: int, *names: str) -> Archetype:
+        """預先建立 names 這組 component 的 archetype 並配置 capacity 列 (例如有上限的粒子)"""
+        archetype = self._archetype(frozenset(names))
+        archetype.reserve(capacity)
+        return archetype
+
+    def spawn(self, **components) -> int:
+        archetype = self._archetype(frozenset(components))
+        eid = int(self._reserve_ids(1)[0])
+        self._row[eid] = archetype.append(eid, components)
+        self._archetype_of[eid] = archetype.index
+        return eid
+
+    def spawn_many(self, count: int, **components) -> np.ndarray:
+        """批次版 spawn (例如粒子)：同一組 component 的 count 個實體，回傳 entity id 陣列"""
+        archetype = self._archetype(frozenset(components))
+        eids = self._reserve_ids(count)
+        start = archetype.count
+        archetype.extend(eids, components)
+        self._row[eids] = np.arange(start, start + count)
+        self._archetype_of[eids] = archetype.index
+        return eids
+
+    def destroy(self, eid: int):
+        if eid in self:
+            self._pending_destroy.append(eid)
+
+    def _locate(self, eid: int) -> tuple[Archetype, int]:
+        if eid not in self:
+            raise KeyError(eid)
+        return self._by_index[self._archetype_of[eid]], int(self._row[eid])
+
+    def get(self, eid: int, name: str):
+        """實體某個 component 的目前值 (向量 component 回傳 view，可原地修改)"""
+        archetype, row = self._locate(eid)
+        return archetype.column(name)[row]
+
+    def set(self, eid: int, name: str, value):
+        archetype, row = self._locate(eid)
+        archetype.column(name)[row] = value
+
+    def query(self, *names: str) -> list[Archetype]:
+        wanted = set(names)
+        return [archetype for archetype in self._by_index if archetype.count and wanted <= archetype.names]
+
+    def remove(self, archetype: Archetype, alive: np.ndarray):
+        """system 用: 移除 archetype 中 alive 為 False 的實體 (立即生效)"""
+        if alive.all():
+            return
+        removed = archetype.keep(alive)
+        self._archetype_of[removed] = -1
+        self._row[removed] = -1
+        self._count -= len(removed)
+        self._retired.append(removed)
+        count = archetype.count
+        self._row[archetype.entities[:count]] = np.arange(count)
+
+    def flush(self):
+        if not self._pending_destroy:
+            self._recycle_retired()
+            return
+        pending = np.unique(np.array(self._pending_destroy, dtype=np.int64))
+        self._pending_destroy.clear()
+        pending = pending[self._archetype_of[pending] >= 0]
+        for archetype in self._by_index:
+            mine = pending[self._archetype_of[pending] == archetype.index]
+            if len(mine):
+                alive = np.ones(archetype.count, dtype=bool)
+                alive[self._row[mine]] = False
+                self.remove(archetype, alive)
+        self._recycle_retired()
+
+    def clear(self):
+        for archetype in self._by_index:
+            archetype.keep(np.zeros(archetype.count, dtype=bool))
+        self._archetype_of[:] = -1
+        self._row[:] = -1
+        self._next_id = 0  # 所有 id 都空出來了，從頭配
+        self._count = 0
+        self._free_count = 0
+        self._retired.clear()
+        self._pending_destroy.clear()
+
+    # ---- resources ----
+    def add_sheet(self, frames) -> int:
+        self.sheets.append(list(frames))
+        return len(self.sheets) - 1
+
+    # ---- systems ----
+    def step(self, dt: float):
+        for system in self.systems:
+            system.update(self, dt)
+        self.flush()
@@ -6,9 +6,13 @@ from pygame.math import Vector2 as vector
 
 from configs.settings import *
 from model.service.event_bus import GLOBAL_EVENTS
+from model.service.sim_clock import SIM_CLOCK
 
 
 class Combatant(pygame.sprite.Sprite):
+    # path -> (animations, frame_masks, flash_frames)；同一資料夾的動畫只載入 / 計算一次，所有實例共用
+    _animation_cache: dict[str, tuple[dict, dict, dict]] = {}
+
     def __init__(self, position, path, groups, shoot):
         super().__init__(groups)
 
@@ -22,7 +26,7 @@ class Combatant(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(topleft=position)
         self.old_rect = self.rect.copy()  # 用來儲存上幀的 rect，避免碰撞檢測時使用當前 rect 導致錯誤
         self.z = LAYERS['Level']
-        self.mask = pygame.mask.from_surface(self.image)  # 用於碰撞檢測的遮罩
+        self.mask = self.frame_masks[self.status][self.frame_index]  # 用於碰撞檢測的遮罩
 
         # float variables for movement
         # 速度 (像素/秒)。搭配 dt (秒) 讓移動與幀率無關
@@ -58,29 +62,36 @@ class Combatant(pygame.sprite.Sprite):
     def blink(self):
         if not self.is_vulnerable:
             if self.wave_value():
-                mask = pygame.mask.from_surface(self.image)
-                white_surface = mask.to_surface()
-                white_surface.set_colorkey((0, 0, 0))  # 設置透明色
-                self.image = white_surface
+                self.image = self.flash_frames[self.status][int(self.frame_index)]
 
     def wave_value(self):
-        value = sin(pygame.time.get_ticks() / 200) * 10
+        value = sin(SIM_CLOCK.ticks / 200) * 10
         if value >= 0:
             return True
 
         return False
 
+    def carry(self, dx, dy):
+        """被移動平台載著走 (CarrierSystem)：dy 讓腳底貼齊平台上緣"""
+        self.rect.move_ip(dx, dy)
+        self.position.x += dx
+        self.position.y = self.rect.y
+        for group in self.groups():
+            if hasattr(group, 'moved'):
+                group.moved(self, dx, dy)
+
     def damage(self):
         if self.is_vulnerable:
             self.health -= 1
             self.is_vulnerable = False
-            self.hit_time = pygame.time.get_ticks()
+            self.hit_time = SIM_CLOCK.ticks
             self.hit_sound.play()  # 播放受傷音效
             GLOBAL_EVENTS.emit('health_changed', current=self.health, max_hp=getattr(self, 'max_health', self.health), entity_id=id(self))
+            GLOBAL_EVENTS.emit('entity_hit', entity_id=id(self), type=self.__class__.__name__, position=self.rect.center)
 
     def check_death(self):
         if self.health <= 0:
-            GLOBAL_EVENTS.emit('entity_died', entity_id=id(self), type=self.__class__.__name__)
+            GLOBAL_EVENTS.emit('entity_died', entity_id=id(self), type=self.__class__.__name__, position=self.rect.center)
             self.kill()
 
     def animate(self, dt):
@@ -90,24 +101,30 @@ class Combatant(pygame.sprite.Sprite):
             self.frame_index = 0
 
         self.image = self.animations[self.status][int(self.frame_index)]
-        self.mask = pygame.mask.from_surface(self.image)  # 用於碰撞檢測的遮罩
+        self.mask = self.frame_masks[self.status][int(self.frame_index)]  # 用於碰撞檢測的遮罩
 
     def shoot_timer(self):
         if not self.can_shoot:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.shoot_time >= self.cooldown:
+            if SIM_CLOCK.ticks - self.shoot_time >= self.cooldown:
                 self.can_shoot = True
 
     def invul_timer(self):
         if not self.is_vulnerable:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.hit_time > self.invul_duration:
+            if SIM_CLOCK.ticks - self.hit_time > self.invul_duration:
                 self.is_vulnerable = True
 
     def import_assets(self, path):
         # 跨平台載入動畫資源 (Windows/MacOS 都可)
+        # 每一幀同時預先算好碰撞遮罩與受傷閃白的剪影，animate / blink 只需要查表
+        cached = Combatant._animation_cache.get(str(path))
+        if cached:
+            self.animations, self.frame_masks, self.flash_frames = cached
+            return
+
         base = Path(path)
         self.animations = {}
+        self.frame_masks = {}
+        self.flash_frames = {}
 
         if not base.exists():
             return
@@ -126,6 +143,15 @@ class Combatant(pygame.sprite.Sprite):
                 surface = pygame.image.load(str(file_path)).convert_alpha()
                 self.animations[direction].append(surface)
 
+            self.frame_masks[direction] = [pygame.mask.from_surface(frame) for frame in self.animations[direction]]
+            self.flash_frames[direction] = []
+            for mask in self.frame_masks[direction]:
+                white_surface = mask.to_surface()
+                white_surface.set_colorkey((0, 0, 0))  # 設置透明色
+                self.flash_frames[direction].append(white_surface)
+
+        Combatant._animation_cache[str(path)] = (self.animations, self.frame_masks, self.flash_frames)
+
         # # 這裡可以載入玩家的圖片、音效等資源
         # self.animations = {}
 
@@ -1,25 +1,35 @@
 import pygame
 from pygame.math import Vector2 as vector
-import random
 from pathlib import Path
 
 from model.entity.combatant.base import Combatant
 from model.entity.item import HealItem
 from configs.settings import HEAL_ITEM_IMG, HEAL_ITEM_BIG_IMG, HEAL_ITEM_SOUP_IMG, HEAL_ITEM_CLAM_SOUP_IMG, BASE_DIR
 from model.service.event_bus import GLOBAL_EVENTS
+from model.service.sim_clock import SIM_CLOCK
 from typing import Any
 
 
 class Enemy(Combatant):
-    def __init__(self, position, path, groups, shoot, player, collision_sprites, assets=None, kind: str = 'default'):
+    # (幀數, dt) -> 從 frame_index 0 開始，animate 幾個 tick 後回到 0
+    _animation_periods: dict[tuple[int, float], int] = {}
+    MUZZLE_Y = -16  # 子彈出生點相對 rect.center 的高度
+
+    def __init__(self, position, path, groups, shoot, player, collision_sprites, assets=None, kind: str = 'default', tile_grid=None):
         super().__init__(position, path, groups, shoot)
         self.player = player  # 玩家物件
         self.collision_sprites = collision_sprites
-        for sprite in collision_sprites.sprites():
-            if sprite.rect.collidepoint(self.rect.midbottom):
+        self.active = True  # False: 離鏡頭太遠 (ActivitySystem)，只處理死亡，之後休眠
+        if tile_grid is not None:
+            if tile_grid.solid_at(*self.rect.midbottom):
+                self.rect.bottom = self.rect.top + 80  # 確保敵人不會穿過地面
+        else:
+            for sprite in collision_sprites.query(pygame.Rect(self.rect.midbottom, (1, 1))):
                 self.rect.bottom = self.rect.top + 80  # 確保敵人不會穿過地面
         # data-driven stats
         self.cooldown = 1000
+        self.fire_range = 600  # 與玩家距離小於這個值 (px) 才開火
+        self.aim_band = 20  # 玩家中心高度在自己 rect 上下這個範圍 (px) 內才開火
         if assets:
             enemies_cfg_path = str(Path(BASE_DIR) / 'configs' / 'enemies.json')
             try:
@@ -27,34 +37,33 @@ class Enemy(Combatant):
                 data = enemies_cfg.get(kind, enemies_cfg.get('default', {}))
                 self.health = data.get('health', self.health)
                 self.cooldown = data.get('cooldown_ms', self.cooldown)
+                self.fire_range = data.get('range_px', self.fire_range)
+                self.aim_band = data.get('aim_band_px', self.aim_band)
                 self._drop_table_name = data.get('drop_table', 'standard_items')
             except Exception:
                 self._drop_table_name = 'standard_items'
         else:
             self._drop_table_name = 'standard_items'
 
-    def get_status(self):
-        # 檢查玩家位置來決定敵人狀態
-        if self.player.rect.centerx < self.rect.centerx:
-            self.status = 'left'
-        else:
-            self.status = 'right'
-
-    def check_fire(self):
-        enemy_position = vector(self.rect.center)
-        player_position = vector(self.player.rect.center)
-
-        distance = (player_position - enemy_position).magnitude()
-        same_y = True if self.rect.top - 20 < player_position.y < self.rect.bottom + 20 else False
+    # ---- AI (EnemyAISystem 批次決定朝向與是否開火) ----
+    def face(self, status: str):
+        """轉向 ('left' / 'right')；這個 tick 已經 animate 過，換成新方向的同一幀"""
+        if status == self.status:
+            return
+        self.status = status
+        frame = int(self.frame_index)
+        self.image = self.animations[status][frame]
+        self.mask = self.frame_masks[status][frame]
+        self.blink()
 
-        if distance < 600 and same_y and self.can_shoot:
-            bullet_direction = vector(1, 0) if self.status == 'right' else vector(-1, 0)
-            y_offset = vector(0, -16)
-            position = self.rect.center + bullet_direction * 80
-            self.shoot(position + y_offset, bullet_direction, self)
+    def fire(self):
+        bullet_direction = vector(1, 0) if self.status == 'right' else vector(-1, 0)
+        y_offset = vector(0, self.MUZZLE_Y)
+        position = self.rect.center + bullet_direction * 80
+        self.shoot(position + y_offset, bullet_direction, self)
 
-            self.can_shoot = False
-            self.shoot_time = pygame.time.get_ticks()  # 記錄射擊時間
+        self.can_shoot = False
+        self.shoot_time = SIM_CLOCK.ticks  # 記錄射擊時間
 
     def check_death(self):
         if self.health <= 0:
@@ -73,10 +82,10 @@ class Enemy(Combatant):
                         tables = items_cfg.get('tables', {})
                         global_cfg = items_cfg.get('global', {})
                         drop_chance = float(global_cfg.get('drop_chance', 0.5))
-                        if random.random() < drop_chance:
+                        if SIM_CLOCK.random.random() < drop_chance:
                             table = tables.get(getattr(self, '_drop_table_name', 'standard_items'), [])
                             total = sum(entry.get('weight', 1) for entry in table) or 1
-                            r = random.uniform(0, total)
+                            r = SIM_CLOCK.random.uniform(0, total)
                             upto = 0
                             selected = table[0] if table else None
                             for entry in table:
@@ -103,13 +112,69 @@ class Enemy(Combatant):
                 except Exception:
                     # fallback silence
                     pass
+            GLOBAL_EVENTS.emit('entity_died', entity_id=id(self), type=self.__class__.__name__, position=self.rect.center)
             self.kill()
 
+    # ---- activity (ActivitySystem) ----
+    @property
+    def at_rest(self) -> bool:
+        return not self.active
+
+    def wake(self):
+        for group in self.groups():
+            if hasattr(group, 'wake'):
+                group.wake(self)
+
+    def activate(self, skipped_ticks: int, dt: float):
+        """回到鏡頭附近: 補上休眠期間的動畫相位 (與一直完整更新的結果相同)，恢復完整 update"""
+        self.active = True
+        self._skip_animation(skipped_ticks, dt)
+        self.wake()
+
+    def deactivate(self):
+        self.active = False
+
+    def _skip_animation(self, ticks: int, dt: float):
+        """frame_index 等同連續 animate(dt) ticks 次 (歸零之後按週期取餘數，不逐 tick 重播)"""
+        frames = len(self.animations[self.status])
+        step = 7 * dt
+        index = self.frame_index
+        while ticks > 0:
+            index += step
+            ticks -= 1
+            if index >= frames:
+                index = 0
+                ticks %= self._animation_period(frames, dt)
+        self.frame_index = index
+
+    @classmethod
+    def _animation_period(cls, frames: int, dt: float) -> int:
+        key = (frames, dt)
+        period = cls._animation_periods.get(key)
+        if period is None:
+            index, period = 0, 0
+            while True:
+                index += 7 * dt
+                period += 1
+                if index >= frames:
+                    break
+            cls._animation_periods[key] = period
+        return period
+
+    def damage(self):
+        super().damage()
+        if not self.active:
+            self.wake()  # 休眠中被打到也要跑一次 update 判斷死亡
+
     def update(self, dt):
-        self.get_status()
+        if not self.active:
+            # 休眠: 不動畫、不射擊 (射程 range_px 在鏡頭範圍內，遠處本來就不會開火)；計時器以時間戳記判斷，不需要每 tick 跑
+            self.invul_timer()
+            self.check_death()
+            return
+        # 朝向與開火由 EnemyAISystem 在所有 sprite update 之後一次算完
         self.animate(dt)  # 更新動畫
         self.blink()
         self.invul_timer()
         self.shoot_timer()  # 檢查射擊冷卻時間
-        self.check_fire()  # 檢查是否可以射擊
         self.check_death()
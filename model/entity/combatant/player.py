@@ -4,6 +4,7 @@ from pygame.math import Vector2 as vector
 from model.entity.combatant.base import Combatant
 from configs.settings import HEAL_ITEM_CLAM_SOUP_IMG
 from model.service.event_bus import GLOBAL_EVENTS
+from model.service.sim_clock import SIM_CLOCK
 
 
 class Player(Combatant):
@@ -17,7 +18,6 @@ class Player(Combatant):
         self.gravity = 15
         self.jump_speed = 600
         self.on_floor = False
-        self.moving_floor = None
 
         # health
         self.health = 30
@@ -42,12 +42,8 @@ class Player(Combatant):
         bottom_rect = pygame.Rect(0, 0, self.rect.width, 5)
         bottom_rect.midtop = self.rect.midbottom
 
-        for sprite in self.collision_sprites.sprites():
-            if sprite.rect.colliderect(bottom_rect):
-                if self.direction.y > 0:
-                    self.on_floor = True
-                if hasattr(sprite, 'direction'):
-                    self.moving_floor = sprite
+        if self.direction.y > 0 and self.collision_sprites.query(bottom_rect):
+            self.on_floor = True
 
     # get the player input (all arrow keys: left, right, up, down)
     def input(self):
@@ -77,11 +73,12 @@ class Player(Combatant):
             self.shoot(position + y_offset, direction, self)
 
             self.can_shoot = False
-            self.shoot_time = pygame.time.get_ticks()  # 記錄射擊時間
+            self.shoot_time = SIM_CLOCK.ticks  # 記錄射擊時間
             self.shoot_sound.play()  # 播放射擊音效
 
     def collision(self, direction):
-        for sprite in self.collision_sprites:
+        # 修正只會把 rect 推回 old_rect 的方向，所以查詢兩者的聯集就涵蓋迴圈中可能碰到的所有物件
+        for sprite in self.collision_sprites.query(self.rect.union(self.old_rect)):
             if sprite.rect.colliderect(self.rect):
                 if direction == 'horizontal':
                     # left collision
@@ -122,19 +119,15 @@ class Player(Combatant):
 
         # vertical movement
         # gravity
-        self.direction.y += self.gravity  # 重力影響
+        self.direction.y += self.gravity * 60 * dt  # 重力影響 (gravity 以 60 Hz 每 tick 的加速度定義，與 tick rate 無關)
         self.position.y += self.direction.y * dt
 
-        # glue the player to the platform
-        if self.moving_floor and self.moving_floor.direction.y > 0 and self.direction.y > 0:
-            self.position.y = 0
-            self.rect.bottom = self.moving_floor.rect.top
-            self.position.y = self.rect.y
-            self.on_floor = True
-
         self.rect.y = round(self.position.y)
         self.collision('vertical')
-        self.moving_floor = None  # 重置移動平台接觸狀態
+
+    def carry(self, dx, dy):
+        super().carry(dx, dy)
+        self.on_floor = True
 
     def add_kill(self):
         self.kill_count += 1
@@ -174,20 +167,4 @@ class Player(Combatant):
                     self.health = max(0, min(self.health + heal, self.max_health))
                     GLOBAL_EVENTS.emit('health_changed', current=self.health, max_hp=self.max_health, entity_id=id(self))
 
-        # github copilot ------
-        # 保存上一幀的平台引用
-        self.previous_moving_floor = self.moving_floor
-        self.moving_floor = None
-
-        # 其他更新邏輯...
-        self.check_contact()  # 這裡會檢測移動平台並更新 self.moving_floor
-
-        # 如果站在移動平台上
-        if self.moving_floor:
-            # 跟隨平台移動
-            self.position.y += self.moving_floor.direction.y * self.moving_floor.speed * dt
-            self.rect.y = round(self.position.y)
-            self.on_floor = True
-        # github copilot ------
-
         self.check_death()
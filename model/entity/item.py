@@ -34,6 +34,18 @@ class BaseItem(pygame.sprite.Sprite):
         self._pos_y = 0.0
         self.effect: ItemEffect | None = None
 
+    @property
+    def at_rest(self) -> bool:
+        """著地後就不需要 update (AllSprites 會讓它睡著)；撿取由玩家對 item_sprites 判斷，不受影響"""
+        return self._landed
+
+    def wake(self):
+        """支撐消失時呼叫 (例如平台移走)：重新受重力影響"""
+        self._landed = False
+        for group in self.groups():
+            if hasattr(group, 'wake'):
+                group.wake(self)
+
     def _physics_init(self):
         self._pos_y = float(self.rect.y)
 
@@ -44,7 +56,7 @@ class BaseItem(pygame.sprite.Sprite):
         self._pos_y += self._vel_y * dt
         self.rect.y = round(self._pos_y)
         if self._collision_sprites:
-            for sprite in self._collision_sprites.sprites():
+            for sprite in self._collision_sprites.query(self.rect):
                 if self.rect.colliderect(sprite.rect) and self._vel_y >= 0 and self.rect.bottom >= sprite.rect.top:
                     self.rect.bottom = sprite.rect.top
                     self._pos_y = self.rect.y
@@ -52,6 +64,16 @@ class BaseItem(pygame.sprite.Sprite):
                     self._landed = True
                     break
 
+    def carry(self, dx, dy):
+        """被移動平台載著走 (CarrierSystem)；落在平台上就算著地"""
+        self.rect.move_ip(dx, dy)
+        self._pos_y = float(self.rect.y)
+        self._vel_y = 0
+        self._landed = True
+        for group in self.groups():
+            if hasattr(group, 'moved'):
+                group.moved(self, dx, dy)
+
     def pick(self, target):
         if self.effect:
             self.effect.apply(target)
@@ -1,9 +1,20 @@
 import pygame
 from configs.settings import *
 from model.service.event_bus import GLOBAL_EVENTS
+from model.service.text_cache import TEXT_CACHE
 
 
 class Overlay:
+    """Player health bar.
+
+    血條只在 health_changed 事件之後重新組成一張 surface，平常每幀只 blit 一次。
+    顯示模式 (HEALTH_BAR_MODE):
+    - 'icons': 每點生命一個圖示 (原本的樣式)
+    - 'segmented': 固定寬度、HEALTH_BAR_SEGMENTS 格的血條
+    - 'numeric': 一個圖示加上 "目前 / 最大" 數字
+    - 'auto': max HP <= HEALTH_ICON_LIMIT 用 icons，否則用 segmented
+    後兩種不論 max HP 多大，組成與繪製成本都固定。
+    """
     def __init__(self, player):
         self.player = player
     # 統一字型: 使用 settings.FONT_DEFAULT (若載入失敗 fallback None)
@@ -20,19 +31,72 @@ class Overlay:
             self.health_surface.fill((255, 0, 0))
         self._cached_health = getattr(player, 'health', 0) if player else 0
         self._cached_max = getattr(player, 'max_health', self._cached_health)
+        self._bar: pygame.Surface | None = None
+        self._bar_state = None  # 組成 _bar 時的 (health, max_hp)
         if player:
             GLOBAL_EVENTS.subscribe('health_changed', self._on_health)
 
+    def close(self):
+        GLOBAL_EVENTS.unsubscribe('health_changed', self._on_health)
+
     def _on_health(self, current, max_hp, entity_id):
         if self.player and entity_id == id(self.player):
             self._cached_health = current
             self._cached_max = max_hp
 
-    def display(self):
+    def _mode(self, max_hp: int) -> str:
+        if HEALTH_BAR_MODE != 'auto':
+            return HEALTH_BAR_MODE
+        return 'icons' if max_hp <= HEALTH_ICON_LIMIT else 'segmented'
+
+    def _build_icons(self, health: int) -> pygame.Surface:
+        icon_w, icon_h = self.health_surface.get_size()
+        step = icon_w + 5
+        bar = pygame.Surface((max(1, health * step - 5), icon_h), pygame.SRCALPHA)
+        for h in range(health):
+            bar.blit(self.health_surface, (h * step, 0))
+        return bar
+
+    def _build_segmented(self, health: int, max_hp: int) -> pygame.Surface:
+        icon_h = self.health_surface.get_height()
+        segments = max(1, HEALTH_BAR_SEGMENTS)
+        gap = 3
+        seg_w = max(1, (HEALTH_BAR_WIDTH - gap * (segments - 1)) // segments)
+        bar = pygame.Surface((segments * (seg_w + gap) - gap, icon_h), pygame.SRCALPHA)
+        ratio = health / max_hp if max_hp > 0 else 0
+        filled = ratio * segments  # 可以是小數，最後一格畫部分
+        for i in range(segments):
+            x = i * (seg_w + gap)
+            pygame.draw.rect(bar, HEALTH_BAR_BG_COLOR, (x, 0, seg_w, icon_h))
+            fill = min(1.0, max(0.0, filled - i))
+            if fill > 0:
+                pygame.draw.rect(bar, HEALTH_BAR_COLOR, (x, 0, max(1, round(seg_w * fill)), icon_h))
+        return bar
+
+    def _build_numeric(self, health: int, max_hp: int) -> pygame.Surface:
+        text = TEXT_CACHE.render(self.font, f'{health} / {max_hp}', (255, 255, 255))
+        icon_w, icon_h = self.health_surface.get_size()
+        bar = pygame.Surface((icon_w + 8 + text.get_width(), max(icon_h, text.get_height())), pygame.SRCALPHA)
+        bar.blit(self.health_surface, (0, (bar.get_height() - icon_h) // 2))
+        bar.blit(text, (icon_w + 8, (bar.get_height() - text.get_height()) // 2))
+        return bar
+
+    def _rebuild(self):
+        health = max(0, self._cached_health)
+        max_hp = max(self._cached_max, 1)
+        mode = self._mode(max_hp)
+        if mode == 'segmented':
+            self._bar = self._build_segmented(health, max_hp)
+        elif mode == 'numeric':
+            self._bar = self._build_numeric(health, max_hp)
+        else:
+            self._bar = self._build_icons(health)
+        self._bar_state = (self._cached_health, self._cached_max)
+
+    def display(self, surface: pygame.Surface | None = None):
         if not self.player:
             return
-        health_value = self._cached_health if self.player else 0
-        for h in range(health_value):
-            x = h * (self.health_surface.get_width() + 5)
-            y = WINDOW_HEIGHT - 50
-            self.display_surface.blit(self.health_surface, (x + 20, y))
+        surface = surface or self.display_surface
+        if self._bar_state != (self._cached_health, self._cached_max):
+            self._rebuild()
+        surface.blit(self._bar, (20, surface.get_height() - 50))
@@ -33,6 +33,25 @@ class MovingPlatform(CollisionTile):
         self.max_distance = 800  # 平台上下移動的最大距離
         # github copilot ------
 
+        # 移動路徑上最近的上 / 下邊界 (y)，由 set_travel_limits 在建關卡時算好；None = 沒有邊界
+        self.top_limit: int | None = None
+        self.bottom_limit: int | None = None
+
+    def set_travel_limits(self, borders):
+        """從 border rects 中找出垂直移動路徑 (同一 x 範圍) 上最近的上、下邊界"""
+        rect = self.rect
+        above = []
+        below = []
+        for border in borders:
+            if border.right <= rect.left or border.left >= rect.right:
+                continue  # 不在移動路徑上
+            if border.centery < rect.centery:
+                above.append(border.bottom)
+            else:
+                below.append(border.top)
+        self.top_limit = max(above) if above else None
+        self.bottom_limit = min(below) if below else None
+
     def update(self, dt):
         self.old_rect = self.rect.copy()  # 儲存上幀的 rect
         self.position.y += self.direction.y * self.speed * dt  # 更新位置
@@ -44,3 +63,12 @@ class MovingPlatform(CollisionTile):
         # github copilot ------
 
         self.rect.topleft = (round(self.position.x), round(self.position.y))  # 同步到 rect
+
+
+class CollisionBlock(pygame.sprite.Sprite):
+    """Invisible static collider covering several merged 'Level' tiles (畫面由 baked chunk 負責)."""
+    def __init__(self, rect, groups):
+        super().__init__(groups)
+        self.rect = pygame.Rect(rect)
+        self.old_rect = self.rect.copy()
+        self.z = LAYERS['Level']
@@ -0,0 +1,37 @@
+import pygame
+
+
+def bake_chunks(tiles, chunk_size: int) -> list[tuple[tuple[int, int], pygame.Surface]]:
+    """Bake static tiles into fixed-size chunk surfaces.
+
+    Args:
+        tiles: iterable of (x, y, surface) in pixel coordinates (tile topleft).
+        chunk_size: chunk edge length in pixels.
+
+    Returns:
+        list of (topleft, surface) per non-empty chunk, in row-major order.
+        每個 chunk 會裁切到實際有像素的範圍；完全透明的 chunk 直接丟掉。
+
+    Tiles larger than the grid (e.g. 192x192 stalls) are blitted into every chunk they overlap,
+    so chunk borders never cut a tile. Within a chunk tiles are drawn in the given order,
+    which keeps the original per-layer overdraw order.
+    """
+    chunks: dict[tuple[int, int], pygame.Surface] = {}
+    for x, y, surf in tiles:
+        width, height = surf.get_size()
+        for cx in range(x // chunk_size, (x + width - 1) // chunk_size + 1):
+            for cy in range(y // chunk_size, (y + height - 1) // chunk_size + 1):
+                chunk = chunks.get((cx, cy))
+                if chunk is None:
+                    chunk = chunks[(cx, cy)] = pygame.Surface((chunk_size, chunk_size), pygame.SRCALPHA)
+                chunk.blit(surf, (x - cx * chunk_size, y - cy * chunk_size))
+
+    baked = []
+    for (cx, cy), chunk in sorted(chunks.items(), key=lambda item: (item[0][1], item[0][0])):
+        bounds = chunk.get_bounding_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            continue  # 只有透明像素
+        surface = chunk.subsurface(bounds).convert_alpha()
+        surface.set_alpha(255, pygame.RLEACCEL)  # 大片透明區域用 RLE 跳過，blit 成本只剩實際像素
+        baked.append(((cx * chunk_size + bounds.x, cy * chunk_size + bounds.y), surface))
+    return baked
@@ -0,0 +1,44 @@
+import pygame
+
+
+def merge_tiles(rects, tile_size: int) -> list[pygame.Rect]:
+    """Greedily merge grid-aligned solid tiles into as few axis-aligned rectangles as possible.
+
+    Args:
+        rects: iterable of tile rects in pixel coordinates.
+        tile_size: grid cell edge length in pixels.
+
+    Returns:
+        list of collision rects, in row-major order of their topleft cell.
+        剛好佔滿一格的 tile 會先往右、再整列往下合併；不對齊格子或尺寸不同的 tile 原樣保留。
+
+    The union of the returned rects covers exactly the same pixels as the input, only the seams
+    between neighbouring tiles inside a rect disappear.
+    """
+    cells: set[tuple[int, int]] = set()
+    merged: list[pygame.Rect] = []
+    for rect in rects:
+        if rect.width == rect.height == tile_size and rect.x % tile_size == 0 and rect.y % tile_size == 0:
+            cells.add((rect.x // tile_size, rect.y // tile_size))
+        else:
+            merged.append(pygame.Rect(rect))
+
+    used: set[tuple[int, int]] = set()
+    for col, row in sorted(cells, key=lambda cell: (cell[1], cell[0])):
+        if (col, row) in used:
+            continue
+        # 往右延伸
+        width = 1
+        while (col + width, row) in cells and (col + width, row) not in used:
+            width += 1
+        # 整列往下延伸
+        height = 1
+        while all((col + i, row + height) in cells and (col + i, row + height) not in used for i in range(width)):
+            height += 1
+        for i in range(width):
+            for j in range(height):
+                used.add((col + i, row + j))
+        merged.append(pygame.Rect(col * tile_size, row * tile_size, width * tile_size, height * tile_size))
+
+    merged.sort(key=lambda rect: (rect.y, rect.x))
+    return merged
@@ -1,10 +1,14 @@
 import pygame
 
-from configs.settings import LAYERS, PLAYER_DIR, ENEMY_DIR
+from configs.settings import LAYERS, PLAYER_DIR, ENEMY_DIR, STATIC_CHUNK_SIZE
 from model.entity.combatant.enemy import Enemy
 from model.entity.combatant.player import Player
-from model.entity.tile import Tile, CollisionTile, MovingPlatform
+from model.ecs.bridge import ENTITY_SPAWNERS
+from model.entity.tile import Tile, CollisionBlock, MovingPlatform
+from model.factory.chunk_baker import bake_chunks
+from model.factory.collision_merger import merge_tiles
 from model.service.assets import AssetManager
+from model.service.tile_grid import TileGrid
 
 
 class TMXEntityFactory:
@@ -12,9 +16,9 @@ class TMXEntityFactory:
     Factory for instantiating game world entities and tiles from a Tiled TMX map.
 
     This class orchestrates the creation of:
-    - Collision tiles from the 'Level' tile layer.
-    - Decorative tiles from 'BG', 'BG Detail', 'FG Detail Bottom', and 'FG Detail Top' tile layers,
-        using a LAYERS mapping for draw-order (z-index).
+    - Merged collision blocks and a NumPy occupancy grid (TileGrid) from the 'Level' tile layer.
+    - Baked chunk sprites for every static tile layer ('Level', 'BG', 'BG Detail', 'FG Detail Bottom',
+        'FG Detail Top'), using a LAYERS mapping for draw-order (z-index).
     - Player and enemy entities from the 'Entities' object layer (spawning enemies after the player
         to ensure they can reference the player).
     - Moving platforms and platform border rects from the 'Platforms' object layer.
@@ -27,7 +31,8 @@ class TMXEntityFactory:
     - Tile coordinates are in grid units and converted to pixels using a 64px tile size.
     - The TMX map contains the expected layers by name: 'Level', 'BG', 'BG Detail',
         'FG Detail Bottom', 'FG Detail Top', 'Entities', and 'Platforms'.
-    - Object names in the 'Entities' layer are 'Player' or 'Enemy'.
+    - Object names in the 'Entities' layer are 'Player', 'Enemy', or a name registered in spawners
+        (model.ecs.bridge.ENTITY_SPAWNERS), which is created as an ECS entity in world.
     - Object names in the 'Platforms' layer named 'Platform' are moving platforms; all others are
         treated as platform border regions.
 
@@ -45,6 +50,9 @@ class TMXEntityFactory:
             platform_sprites (pygame.sprite.Group): Group containing moving platforms.
             vulnerable_sprites (pygame.sprite.Group): Group of entities that can take damage.
             shoot_cb (Callable): Callback passed to entities to handle shooting logic.
+            enemy_sprites (pygame.sprite.Group | None): Optional group that receives every enemy.
+            world (World | None): ECS world that receives entities whose TMX object name is in spawners.
+            spawners (dict | None): Object name -> spawn(world, obj); defaults to ENTITY_SPAWNERS.
 
     Notes:
     - The provided groups are mutated: created sprites are added to one or more of them.
@@ -57,21 +65,32 @@ class TMXEntityFactory:
     and collects platform border rectangles.
 
     Processing details:
-    - Collision tiles:
-        - From the 'Level' tile layer; each tile is placed at (x * 64, y * 64).
-    - Decorative tiles:
-        - From 'BG', 'BG Detail', 'FG Detail Bottom', 'FG Detail Top'; each tile is placed at
-            (x * 64, y * 64) with z-order determined by LAYERS[layer].
+    - Collision blocks:
+        - From the 'Level' tile layer; each tile covers (x * 64, y * 64) with its surface size.
+        - Contiguous full cells are greedily merged into the fewest rectangles (merge_tiles), one
+            CollisionBlock per rectangle.
+        - Added to collision_sprites only; their pixels are drawn by the baked 'Level' chunks.
+        - The same tiles are also marked SOLID in self.tile_grid (one uint8 flag byte per cell), for
+            static-terrain lookups that do not need moving platforms.
+    - Static layer chunks:
+        - 'Level', 'BG', 'BG Detail', 'FG Detail Bottom', 'FG Detail Top' are each baked into
+            STATIC_CHUNK_SIZE chunk surfaces (tile topleft at (x * 64, y * 64)), one Tile sprite per
+            non-empty chunk with z-order determined by LAYERS[layer].
+        - Chunks are created before any entity so that, within the same z, they still draw first.
     - Entities:
         - From the 'Entities' object layer.
         - Spawns the Player first (obj.name == 'Player').
         - Buffers enemies (obj.name == 'Enemy') and spawns them after the player is created so enemies
             can reference the player instance.
+        - Objects whose name is in spawners are created with spawners[obj.name](world, obj) (ECS entities,
+            drawn through SpriteBridge) when a world was given.
     - Platforms:
         - From the 'Platforms' object layer.
         - Objects named 'Platform' become MovingPlatform sprites (added to all_sprites, collision_sprites,
             and platform_sprites).
         - Other objects are converted into pygame.Rect instances and returned as platform borders.
+        - Each platform precomputes the nearest border above and below on its vertical path
+            (MovingPlatform.set_travel_limits).
 
     Args:
             tmx_path (str): Filesystem path to the TMX file to load.
@@ -88,6 +107,7 @@ class TMXEntityFactory:
 
     Side effects:
             - Mutates sprite groups by adding created sprites.
+            - Sets self.tile_grid.
     """
     def __init__(
             self,
@@ -96,31 +116,38 @@ class TMXEntityFactory:
             collision_sprites: pygame.sprite.Group,
             platform_sprites: pygame.sprite.Group,
             vulnerable_sprites: pygame.sprite.Group,
-            shoot_cb
+            shoot_cb,
+            enemy_sprites: pygame.sprite.Group | None = None,
+            world=None,
+            spawners: dict | None = None
     ):
         self.assets = assets
         self.all_sprites = all_sprites
         self.collision_sprites = collision_sprites
         self.platform_sprites = platform_sprites
         self.vulnerable_sprites = vulnerable_sprites
+        self.enemy_sprites = enemy_sprites
         self.shoot_cb = shoot_cb
+        self.world = world
+        self.spawners = ENTITY_SPAWNERS if spawners is None else spawners
+        self.tile_grid: TileGrid | None = None  # build_world 之後可用
 
     def build_world(self, tmx_path: str):
         tmx_map = self.assets.tmx(tmx_path)
 
-        # collision tiles
-        for x, y, surf in tmx_map.get_layer_by_name('Level').tiles():
-            CollisionTile(
-                position=(x * 64, y * 64),
-                surface=surf,
-                groups=[self.all_sprites, self.collision_sprites]
-            )
-
-        # decorative tiles
-        for layer in ['BG', 'BG Detail', 'FG Detail Bottom', 'FG Detail Top']:
-            for x, y, surf in tmx_map.get_layer_by_name(layer).tiles():
+        # collision blocks (相鄰的 tile 合併成大矩形，只負責碰撞，畫面由下方 'Level' chunk 繪製)
+        level_rects = [surf.get_rect(topleft=(x * 64, y * 64)) for x, y, surf in tmx_map.get_layer_by_name('Level').tiles()]
+        for rect in merge_tiles(level_rects, 64):
+            CollisionBlock(rect, groups=self.collision_sprites)
+        # 同一層的格子佔用表 (NumPy)，給只關心靜態地形的查詢用
+        self.tile_grid = TileGrid.from_rects(level_rects, 64, cols=tmx_map.width, rows=tmx_map.height)
+
+        # static tile layers → baked chunks
+        for layer in ['Level', 'BG', 'BG Detail', 'FG Detail Bottom', 'FG Detail Top']:
+            tiles = ((x * 64, y * 64, surf) for x, y, surf in tmx_map.get_layer_by_name(layer).tiles())
+            for position, surf in bake_chunks(tiles, STATIC_CHUNK_SIZE):
                 Tile(
-                    position=(x * 64, y * 64),
+                    position=position,
                     surface=surf,
                     groups=self.all_sprites,
                     z=LAYERS[layer]
@@ -141,31 +168,41 @@ class TMXEntityFactory:
                 )
             elif obj.name == 'Enemy':
                 enemies_buffer.append(obj)
+            elif self.world is not None and obj.name in self.spawners:
+                self.spawners[obj.name](self.world, obj)
 
         # spawn enemies after player exists (避免層順序造成 player=None)
+        enemy_groups = [self.all_sprites, self.vulnerable_sprites]
+        if self.enemy_sprites is not None:
+            enemy_groups.append(self.enemy_sprites)
         for obj in enemies_buffer:
             Enemy(
                 position=(obj.x, obj.y),
                 path=str(ENEMY_DIR),
-                groups=[self.all_sprites, self.vulnerable_sprites],
+                groups=enemy_groups,
                 shoot=self.shoot_cb,
                 player=player,
                 collision_sprites=self.collision_sprites,
                 assets=self.assets,
+                tile_grid=self.tile_grid,
                 kind=getattr(obj, 'type', 'default') or 'default'
             )
 
         # moving platforms + borders
         platform_border_rects: list[pygame.Rect] = []
+        platforms: list[MovingPlatform] = []
         for obj in tmx_map.get_layer_by_name('Platforms'):
             if obj.name == 'Platform':
-                MovingPlatform(
+                platforms.append(MovingPlatform(
                     position=(obj.x, obj.y),
                     surface=obj.image,
                     groups=[self.all_sprites, self.collision_sprites, self.platform_sprites]
-                )
+                ))
             else:
                 platform_border_rects.append(pygame.Rect(obj.x, obj.y, obj.width, obj.height))
+        # 每個平台只記下自己路徑上最近的上下邊界，每幀檢查變成兩個數值比較
+        for platform in platforms:
+            platform.set_travel_limits(platform_border_rects)
 
         # attach assets reference for data-driven lookups
         if player:
@@ -12,12 +12,29 @@ class AssetManager:
         self._sounds = {}
         self._tmx = {}
         self._json = {}
+        self._flipped = {}
+        self._masks = {}
 
     def image(self, path: str) -> pygame.Surface:
         if path not in self._images:
             self._images[path] = pygame.image.load(path).convert_alpha()
         return self._images[path]
 
+    def flipped(self, surface: pygame.Surface, flip_x: bool = True, flip_y: bool = False) -> pygame.Surface:
+        """Cached pygame.transform.flip: each source surface is flipped only once."""
+        key = (id(surface), flip_x, flip_y)
+        entry = self._flipped.get(key)
+        if entry is None or entry[0] is not surface:  # 保留來源參照，避免 id 被重複使用
+            entry = self._flipped[key] = (surface, pygame.transform.flip(surface, flip_x, flip_y))
+        return entry[1]
+
+    def mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """Cached pygame.mask.from_surface (mask 為共用物件，請勿修改)"""
+        entry = self._masks.get(id(surface))
+        if entry is None or entry[0] is not surface:
+            entry = self._masks[id(surface)] = (surface, pygame.mask.from_surface(surface))
+        return entry[1]
+
     def sound(self, path: str) -> pygame.mixer.Sound:
         if path not in self._sounds:
             self._sounds[path] = pygame.mixer.Sound(path)
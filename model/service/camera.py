@@ -1,42 +1,230 @@
+import bisect
+import weakref
+from itertools import chain
+
 import pygame
 from pygame.math import Vector2 as vector
-from configs.settings import WINDOW_WIDTH, WINDOW_HEIGHT, SKY_FG, SKY_BG
+from configs.settings import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, PARALLAX_LAYERS, RENDER_CELL_SIZE, RENDER_CULL_MARGIN, RENDER_WIDTH,
+)
+from model.service.parallax import ParallaxLayer
+from model.service.spatial_index import SpatialGrid
 
 class AllSprites(pygame.sprite.Group):
-    """Camera group: handles world offset & parallax sky rendering."""
-    def __init__(self, assets, tmx_map):
+    """Camera group: handles world offset & parallax sky rendering.
+
+    Draw order is kept incrementally: every z value owns a SpatialGrid (in insertion order), the
+    sorted list of z values only changes when a new z shows up, and a sprite is re-bucketed only
+    when its z changes. Rendering walks the z layers in order and only visits sprites near the
+    viewport, so there is no per-frame sort of the world.
+    Static sprites (no update override, e.g. Tile) are indexed once; sprites that can move are
+    re-indexed before each render.
+    The sky is drawn by ParallaxLayer strips configured in PARALLAX_LAYERS (one blit per layer).
+    When the internal render resolution (RENDER_WIDTH) is smaller than the window, the same field of
+    view is drawn with downscaled copies of each image, made once per source surface.
+    update() remembers where every moving sprite was before the tick, so render(alpha) can draw it
+    (and the camera) between the previous and the current position.
+    Only awake sprites are updated: static sprites never are, and a sprite that reports at_rest after
+    its update is put to sleep until something calls wake(sprite) (see BaseItem.wake). Sleeping
+    sprites are not re-indexed either, unless moved(sprite) reports that something else moved them.
+    Things that are not sprites (e.g. the array BulletEngine) draw through add_render_hook(z, draw),
+    called right after the sprites of that z layer.
+    """
+    def __init__(self, assets):
         super().__init__()
         self.display_surface = pygame.display.get_surface()
         self.offset = vector()
         self.half_w = WINDOW_WIDTH / 2
         self.half_h = WINDOW_HEIGHT / 2
+        self.scale = RENDER_WIDTH / WINDOW_WIDTH
+        self._scaled = weakref.WeakKeyDictionary()  # 原圖 -> 內部解析度用的縮小圖
+
+        # z 分層的 spatial index (畫面裁切 + 繪製順序)
+        self._layers: dict[int, SpatialGrid] = {}
+        self._z_order: list[int] = []  # 已排序的 z 值
+        self._z_of: dict = {}  # sprite -> 目前所在的 z bucket
+        self._pending: dict = {}  # 剛加入、可能還沒有 rect 的 sprite
+        self._dynamic: dict = {}  # 會移動的 sprite，每次 render 前同步位置 / z
+        self._prev: dict = {}  # sprite -> 上一個 tick 開始時的 rect.topleft (內插用)
+        self._awake: dict = {}  # 每個 tick 要 update 的 sprite (_dynamic 扣掉睡著的)
+        self._moved: dict = {}  # 睡著但位置 / z 可能改變的 sprite (剛睡著、被平台載著)，下次 render 前同步
+        self._readded: set | None = None  # update() 進行中重新加入的 sprite (SpritePool 回收再用)
+        self._render_hooks: dict[int, list] = {}  # z -> 畫完該層 sprite 後呼叫的 draw(surface, offset, view, alpha)
+        self.view_rect = pygame.Rect(0, 0, WINDOW_WIDTH + 2 * RENDER_CULL_MARGIN, WINDOW_HEIGHT + 2 * RENDER_CULL_MARGIN)
+
+        # Sky layers (第一張圖的左緣對齊 -half_w，與地圖左側留白一致)
+        self.parallax_layers = [
+            ParallaxLayer(assets.image(cfg['image']), cfg['factor'], cfg['y'], -self.half_w, RENDER_WIDTH, self.scale)
+            for cfg in PARALLAX_LAYERS
+        ]
+
+    # ---- group membership → spatial index ----
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        # Sprite.__init__(groups) 會在子類別設定 rect 之前就加入群組，所以延後到下次同步再登錄
+        self._pending[sprite] = None
+        if type(sprite).update is not pygame.sprite.Sprite.update:
+            self._dynamic[sprite] = None
+            self._awake[sprite] = None
+        if self._readded is not None:
+            self._readded.add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._pending.pop(sprite, None)
+        self._dynamic.pop(sprite, None)
+        self._awake.pop(sprite, None)
+        self._moved.pop(sprite, None)
+        self._prev.pop(sprite, None)
+        z = self._z_of.pop(sprite, None)
+        if z is not None:
+            self._layers[z].remove(sprite)
+
+    def _layer(self, z) -> SpatialGrid:
+        grid = self._layers.get(z)
+        if grid is None:
+            grid = self._layers[z] = SpatialGrid(RENDER_CELL_SIZE)
+            bisect.insort(self._z_order, z)
+        return grid
+
+    def _sync_index(self):
+        z_of = self._z_of
+        if self._pending:
+            for sprite in list(self._pending):
+                rect = getattr(sprite, 'rect', None)
+                if rect is not None:
+                    z = getattr(sprite, 'z', 0)
+                    self._layer(z).insert(sprite, rect)
+                    z_of[sprite] = z
+                    del self._pending[sprite]
+        layers = self._layers
+        moved = self._moved
+        for sprite in chain(self._awake, moved):
+            z = z_of.get(sprite)
+            if z is None:
+                continue
+            new_z = getattr(sprite, 'z', 0)
+            if new_z != z:
+                # z 改變才換 bucket (排到新層的最後，與重新加入群組相同)
+                layers[z].remove(sprite)
+                z = new_z
+                self._layer(z).insert(sprite, sprite.rect)
+                z_of[sprite] = z
+            else:
+                layers[z].move(sprite, sprite.rect)
+        moved.clear()
+
+    def add_render_hook(self, z, draw):
+        """draw(surface, offset, view, alpha) 在 z 層的 sprite 畫完後呼叫；offset 為整數鏡頭位移，view 為裁切範圍 (世界座標)"""
+        self._layer(z)  # 該層即使沒有 sprite 也要走訪到
+        self._render_hooks.setdefault(z, []).append(draw)
+
+    # ---- sleep / wake ----
+    def wake(self, sprite):
+        """讓睡著的 sprite 從下一個 tick 起重新 update"""
+        if sprite in self._dynamic:
+            self._awake[sprite] = None
+
+    def moved(self, sprite, dx: int = 0, dy: int = 0):
+        """sprite 被外力移動 (dx, dy) 後呼叫 (例如 CarrierSystem)：睡著的下次 render 前重新登錄位置，
+        並記下移動前的位置，繪製時和載著它的平台一起內插 (醒著的已在 update 開頭記錄過)"""
+        if sprite in self._dynamic:
+            self._moved[sprite] = None
+            rect = sprite.rect
+            self._prev.setdefault(sprite, (rect.x - dx, rect.y - dy))
+
+    @property
+    def awake_count(self) -> int:
+        return len(self._awake)
+
+    def update(self, *args, **kwargs):
+        awake = list(self._awake)
+        prev = self._prev
+        prev.clear()
+        for sprite in awake:
+            rect = getattr(sprite, 'rect', None)
+            if rect is not None:
+                prev[sprite] = (rect.x, rect.y)
+        # 在這個 tick 中被 kill 又重新加入的 sprite (物件池) 視同新 sprite，下個 tick 才 update
+        readded = self._readded = set()
+        for sprite in awake:
+            if readded and sprite in readded:
+                continue
+            sprite.update(*args, **kwargs)
+            if getattr(sprite, 'at_rest', False):
+                self._awake.pop(sprite, None)  # 睡著: 之後不再 update，直到 wake()
+                self._moved[sprite] = None  # 最後一次 update 的位置還沒同步到索引
+        self._readded = None
+
+    def _shifts(self, alpha: float) -> dict:
+        """sprite -> 繪製時相對目前 rect 的整數位移 (往上一個 tick 的位置退回 1 - alpha)"""
+        if alpha >= 1.0 or not self._prev:
+            return {}
+        back = 1.0 - alpha
+        shifts = {}
+        for sprite, (x, y) in self._prev.items():
+            rect = sprite.rect
+            if x != rect.x or y != rect.y:
+                shifts[sprite] = (round((x - rect.x) * back), round((y - rect.y) * back))
+        return shifts
+
+    # ---- rendering ----
+    def scaled_image(self, image: pygame.Surface) -> pygame.Surface:
+        scaled = self._scaled.get(image)
+        if scaled is None:
+            size = (max(1, round(image.get_width() * self.scale)), max(1, round(image.get_height() * self.scale)))
+            if image.get_colorkey() is not None:
+                # colorkey 圖 (受傷閃白) 不能平滑縮放，否則透明色會混進邊緣
+                scaled = pygame.transform.scale(image, size)
+                scaled.set_colorkey(image.get_colorkey())
+            else:
+                scaled = pygame.transform.smoothscale(image, size)
+                if image.get_flags() & pygame.RLEACCEL:
+                    scaled.set_alpha(255, pygame.RLEACCEL)
+            self._scaled[image] = scaled
+        return scaled
+
+    def _render_background(self, surface):
+        for layer in self.parallax_layers:
+            layer.draw(surface, self.offset)
+
+    def _render_sprites(self, surface, shifts: dict, alpha: float = 1.0):
+        self._sync_index()
+        ox = round(self.offset.x)
+        oy = round(self.offset.y)
+        view = self.view_rect
+        view.topleft = (ox - RENDER_CULL_MARGIN, oy - RENDER_CULL_MARGIN)
+        blit = surface.blit
+        layers = self._layers
+        scale = self.scale
+        hooks = self._render_hooks
+        for z in self._z_order:
+            for sprite in layers[z].query(view):
+                # 等同 image.get_rect(center=rect.center)，但不為每個 sprite 建立新的 Rect
+                image = sprite.image
+                rect = sprite.rect
+                x = rect.x + (rect.width >> 1) - (image.get_width() >> 1) - ox
+                y = rect.y + (rect.height >> 1) - (image.get_height() >> 1) - oy
+                if shifts:
+                    shift = shifts.get(sprite)
+                    if shift:
+                        x += shift[0]
+                        y += shift[1]
+                if scale == 1:
+                    blit(image, (x, y))
+                else:
+                    blit(self.scaled_image(image), (int(x * scale), int(y * scale)))
+            for draw in hooks.get(z, ()):
+                draw(surface, (ox, oy), view, alpha)
 
-        # Sky layers
-        self.fg_sky = assets.image(SKY_FG)
-        self.bg_sky = assets.image(SKY_BG)
-
-        # Compute repeat count based on map width
-        self.padding = self.half_w
-        self.sky_width = self.bg_sky.get_width()
-        map_width = tmx_map.tilewidth * tmx_map.width + (2 * self.padding)
-        self.sky_num = int(map_width // self.sky_width)
-
-    def _render_background(self):
-        for x in range(self.sky_num):
-            x_pos = -self.padding + (x * self.sky_width)
-            self.display_surface.blit(self.bg_sky, (x_pos - self.offset.x / 2.5, 850 - self.offset.y / 2.5))
-            self.display_surface.blit(self.fg_sky, (x_pos - self.offset.x / 2, 850 - self.offset.y / 2))
-
-    def _render_sprites(self):
-        for sprite in sorted(self.sprites(), key=lambda spr: getattr(spr, 'z', 0)):
-            offset_rect = sprite.image.get_rect(center=sprite.rect.center)
-            offset_rect.center -= self.offset
-            self.display_surface.blit(sprite.image, offset_rect)
-
-    def render(self, player):
+    def render(self, player, surface: pygame.Surface | None = None, alpha: float = 1.0):
         if not player:
             return
-        self.offset.x = player.rect.centerx - self.half_w
-        self.offset.y = player.rect.centery - self.half_h
-        self._render_background()
-        self._render_sprites()
+        surface = surface or self.display_surface
+        shifts = self._shifts(alpha)
+        # 鏡頭跟著玩家的內插位置 (位移取整數，玩家在畫面上不會抖動)
+        dx, dy = shifts.get(player, (0, 0))
+        self.offset.x = player.rect.centerx + dx - self.half_w
+        self.offset.y = player.rect.centery + dy - self.half_h
+        self._render_background(surface)
+        self._render_sprites(surface, shifts, alpha)
@@ -0,0 +1,49 @@
+import math
+
+import pygame
+
+
+class ParallaxLayer:
+    """One horizontally repeating parallax layer (e.g. sky).
+
+    關卡建立時把圖片預先鋪成一條 wrap-around strip (寬度 = 圖寬 + 視窗寬)，
+    每幀只需用 area 從 strip 上取出與視窗重疊的那一段 blit 一次，成本與地圖寬度無關。
+
+    Args:
+        image: source surface, repeated every image width.
+        factor: camera offset divisor (越大移動越慢、看起來越遠)。
+        y: screen y of the layer when the camera offset is 0.
+        origin_x: world x of the first copy (repeat phase).
+        view_width: width of the surface the layer is drawn onto.
+        scale: render scale (internal render resolution / window); y, origin_x are window pixels.
+    """
+    def __init__(self, image: pygame.Surface, factor: float, y: float, origin_x: float, view_width: int,
+                 scale: float = 1.0):
+        if scale != 1:
+            image = pygame.transform.smoothscale(
+                image, (max(1, round(image.get_width() * scale)), max(1, round(image.get_height() * scale))))
+        self.factor = factor
+        self.scale = scale
+        self.y = y * scale
+        self.origin_x = origin_x * scale
+        self.tile_width = image.get_width()
+        self.height = image.get_height()
+
+        copies = math.ceil((self.tile_width + view_width) / self.tile_width)
+        opaque = pygame.mask.from_surface(image, 254).count() == self.tile_width * self.height
+        strip = pygame.Surface((self.tile_width + view_width, self.height), 0 if opaque else pygame.SRCALPHA)
+        for i in range(copies):
+            strip.blit(image, (i * self.tile_width, 0))
+        # 完全不透明的圖用 convert() 存成無 alpha 格式，blit 時不必逐像素混色
+        self.strip = strip.convert() if opaque else strip.convert_alpha()
+        self.area = pygame.Rect(0, 0, view_width, self.height)
+
+    def draw(self, surface: pygame.Surface, offset):
+        y = int(self.y - offset.y * self.scale / self.factor)
+        if y >= surface.get_height() or y + self.height <= 0:
+            return
+        # 螢幕上第一個與視窗重疊的 copy (x 取整方式與 pygame blit 浮點座標相同：向 0 截斷)
+        x0 = self.origin_x - offset.x * self.scale / self.factor
+        first = math.floor(-x0 / self.tile_width)
+        self.area.x = -int(x0 + first * self.tile_width)
+        surface.blit(self.strip, (0, y), self.area)
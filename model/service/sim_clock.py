@@ -0,0 +1,38 @@
+import random
+
+from configs.settings import SIM_SEED
+
+
+class SimClock:
+    """Simulation clock advanced by the fixed tick dt (GameApp.update), not by the wall clock.
+
+    遊戲邏輯的計時 (射擊冷卻、無敵時間、受傷閃爍、子彈射程) 都讀 ticks，
+    結果只跟跑過幾個 tick 有關，與機器快慢 / 畫面更新率無關，所以可以不限速地跑 (SIM_UNCAPPED)
+    且每次結果相同。ticks 與 pygame.time.get_ticks() 一樣是毫秒整數，
+    是目前這個 tick 開始時的模擬時間 (update 跑完才 advance)。
+    遊戲邏輯的亂數 (例如敵人掉落) 用 random；reset() 以 seed 重新設定，seed 固定時同樣的輸入每局結果相同。
+
+    Usage:
+        SIM_CLOCK.advance(dt)
+        if SIM_CLOCK.ticks - self.shoot_time >= self.cooldown: ...
+        if SIM_CLOCK.random.random() < drop_chance: ...
+    """
+    def __init__(self, seed: int | None = None):
+        self.elapsed = 0.0  # 秒
+        self.ticks = 0  # 毫秒
+        self.seed = seed  # None: 每次 reset 用新的隨機種子
+        self.random = random.Random(seed)
+
+    def advance(self, dt: float):
+        self.elapsed += dt
+        # 累加 1/60 之類的 dt 會有極小的浮點誤差，加一點餘量避免剛好整數毫秒時少 1
+        self.ticks = int(self.elapsed * 1000 + 1e-6)
+
+    def reset(self):
+        """新的一局 (LevelScene.enter)：時間歸零、亂數重新播種"""
+        self.elapsed = 0.0
+        self.ticks = 0
+        self.random.seed(self.seed)
+
+
+SIM_CLOCK = SimClock(SIM_SEED)
@@ -0,0 +1,221 @@
+import pygame
+
+
+class SpatialGrid:
+    """Uniform-grid (bucketed) spatial index for rect-shaped items.
+
+    每個 item 依其 rect 覆蓋到的格子登錄到一個或多個 bucket；
+    查詢時只走訪與查詢矩形重疊的格子，成本與「附近物件數」成正比，而非整張地圖。
+
+    Usage:
+        grid = SpatialGrid(256)
+        grid.insert(sprite, sprite.rect)
+        grid.move(sprite, sprite.rect)      # rect 改變後呼叫，格子範圍沒變時幾乎零成本
+        for sprite in grid.query(view_rect): ...
+        grid.remove(sprite)
+    """
+    def __init__(self, cell_size: int = 256):
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict] = {}
+        self._spans: dict = {}  # item -> (x0, y0, x1, y1) 目前登錄的格子範圍
+        self._order: dict = {}  # item -> 加入序號 (查詢結果維持加入順序)
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, item):
+        return item in self._spans
+
+    def _span(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            max(rect.left, rect.right - 1) // size,
+            max(rect.top, rect.bottom - 1) // size,
+        )
+
+    def _link(self, item, span):
+        cells = self._cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = cells[(cx, cy)] = {}
+                bucket[item] = None
+
+    def _unlink(self, item, span):
+        cells = self._cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(item, None)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def insert(self, item, rect: pygame.Rect):
+        if item in self._spans:
+            self.move(item, rect)
+            return
+        span = self._span(rect)
+        self._spans[item] = span
+        self._order[item] = self._seq
+        self._seq += 1
+        self._link(item, span)
+
+    def remove(self, item):
+        span = self._spans.pop(item, None)
+        if span is None:
+            return
+        del self._order[item]
+        self._unlink(item, span)
+
+    def move(self, item, rect: pygame.Rect) -> bool:
+        """更新 item 位置；回傳格子範圍是否有變 (沒變就不動 bucket)"""
+        old = self._spans.get(item)
+        if old is None:
+            self.insert(item, rect)
+            return True
+        span = self._span(rect)
+        if span == old:
+            return False
+        self._unlink(item, old)
+        self._link(item, span)
+        self._spans[item] = span
+        return True
+
+    def clear(self):
+        self._cells.clear()
+        self._spans.clear()
+        self._order.clear()
+
+    def query(self, rect: pygame.Rect, ordered: bool = True) -> list:
+        """回傳所有登錄格子與 rect 重疊的 item (依加入順序，不重複)
+
+        注意這是格子層級的粗篩 (broad phase)，呼叫端仍需自行做精確的 rect 測試。
+        ordered=False 時不排序 (順序不定)，給只在意「有沒有」的呼叫端用。
+        """
+        cells = self._cells
+        x0, y0, x1, y1 = self._span(rect)
+        found = {}
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # 查詢範圍比有東西的格子還多 (例如很大的 rect)，改走訪有東西的格子
+            for (cx, cy), bucket in cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    found.update(bucket)
+        else:
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        found.update(bucket)
+        if len(found) < 2 or not ordered:
+            return list(found)
+        return sorted(found, key=self._order.__getitem__)
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """Sprite group with a SpatialGrid index, for collision queries (collision_sprites).
+
+    靜態 sprite (例如 CollisionBlock) 加入時登錄一次；會移動的 sprite (有覆寫 update，例如
+    MovingPlatform) 在每次 query 前同步位置，格子範圍沒變時幾乎零成本。
+    dynamic=False 時不自動同步 (成員只會被外力移動，例如被平台載著的敵人)，移動後呼叫 moved(sprite)。
+    仍是一般的 Group，groupcollide / sprites() / empty() 照常可用。
+
+    Usage:
+        for sprite in collision_sprites.query(player.rect):
+            ...
+    """
+    def __init__(self, cell_size: int = 128, *sprites, dynamic: bool = True):
+        self._grid = SpatialGrid(cell_size)
+        self._pending: dict = {}  # 剛加入、可能還沒有 rect 的 sprite
+        self._dynamic: dict = {}
+        self._track_updates = dynamic
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        # Sprite.__init__(groups) 會在子類別設定 rect 之前就加入群組，所以延後到查詢時再登錄
+        self._pending[sprite] = None
+        if self._track_updates and type(sprite).update is not pygame.sprite.Sprite.update:
+            self._dynamic[sprite] = None
+
+    def moved(self, sprite, dx: int = 0, dy: int = 0):
+        """sprite 被外力移動 (dx, dy) 後呼叫 (下次 query 前重新登錄)；參數與 AllSprites.moved 相同"""
+        if sprite in self._grid:
+            self._pending[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._pending.pop(sprite, None)
+        self._dynamic.pop(sprite, None)
+        self._grid.remove(sprite)
+
+    def _sync(self):
+        grid = self._grid
+        if self._pending:
+            for sprite in list(self._pending):
+                if getattr(sprite, 'rect', None) is not None:
+                    grid.insert(sprite, sprite.rect)
+                    del self._pending[sprite]
+        for sprite in self._dynamic:
+            if sprite in grid:
+                grid.move(sprite, sprite.rect)
+
+    def query(self, rect: pygame.Rect) -> list:
+        """回傳 rect 與查詢範圍重疊 (colliderect) 的 sprite，依加入群組的順序"""
+        self._sync()
+        return [sprite for sprite in self._grid.query(rect) if sprite.rect.colliderect(rect)]
+
+    def overlapping(self, sprites) -> list:
+        """回傳 sprites 中與任一碰撞物 rect 重疊的那些 (只同步一次，適合大量子彈之類的批次檢查)"""
+        self._sync()
+        query = self._grid.query
+        result = []
+        for sprite in sprites:
+            rect = sprite.rect
+            for other in query(rect, ordered=False):
+                if other.rect.colliderect(rect):
+                    result.append(sprite)
+                    break
+        return result
+
+
+def sweep_and_prune(boxes_a, boxes_b) -> list[tuple]:
+    """Broad phase on the x axis between two sets of boxes (橫向捲軸遊戲物件主要沿 x 分布).
+
+    Args:
+        boxes_a, boxes_b: iterables of (item, rect).
+
+    Returns:
+        list of (item_a, item_b) whose rects overlap on x (順序不定，呼叫端仍需做 y / 精確測試)。
+
+    兩邊各依 left 排序後合併掃描，只和「還沒結束」的另一邊區間配對，
+    成本約 O((A + B) log(A + B) + 配對數)，而不是 O(A x B)。
+    """
+    boxes_a = sorted(boxes_a, key=lambda box: box[1].left)
+    boxes_b = sorted(boxes_b, key=lambda box: box[1].left)
+    active_a: list = []
+    active_b: list = []
+    pairs = []
+    i = j = 0
+    while i < len(boxes_a) or j < len(boxes_b):
+        if j >= len(boxes_b) or (i < len(boxes_a) and boxes_a[i][1].left <= boxes_b[j][1].left):
+            item, rect = boxes_a[i]
+            i += 1
+            left = rect.left
+            active_b = [box for box in active_b if box[1].right > left]
+            pairs.extend((item, other) for other, _ in active_b)
+            active_a.append((item, rect))
+        else:
+            item, rect = boxes_b[j]
+            j += 1
+            left = rect.left
+            active_a = [box for box in active_a if box[1].right > left]
+            pairs.extend((other, item) for other, _ in active_a)
+            active_b.append((item, rect))
+    return pairs
@@ -0,0 +1,80 @@
+class SpritePool:
+    """Bounded pool of reusable sprites (Bullet).
+
+    acquire(*args) 先拿回收的 sprite 呼叫 sprite.reset(*args) (重設狀態並重新加入群組)，
+    沒有可回收的才 create(*args) 建新的；sprite 被 kill() 時透過 sprite.pool.release() 回到池中。
+    同時存在的數量不超過 capacity，滿了之後依 overflow:
+    - 'drop_oldest': 提早回收最舊的那一個 (例如最早發射、還在飛的子彈)
+    - 'refuse': 回傳 None，呼叫端放棄這次生成
+    被 Group.empty() 之類移出所有群組、沒經過 kill() 的 sprite (例如換關卡) 也視為可回收。
+
+    hits / misses / dropped / refused 用來調整 capacity：misses 應該只在一開始增加，
+    dropped / refused 持續增加代表池太小。
+
+    Usage:
+        pool = SpritePool(Bullet, capacity=512)
+        bullet = pool.acquire(position, surface, direction, groups, mask)
+    """
+    OVERFLOW_POLICIES = ('drop_oldest', 'refuse')
+
+    def __init__(self, create, capacity: int, overflow: str = 'drop_oldest'):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f'overflow must be one of {self.OVERFLOW_POLICIES}, got {overflow!r}')
+        self.create = create
+        self.capacity = max(1, capacity)
+        self.overflow = overflow
+        self._live: dict = {}  # 發出去還沒回收的 sprite (依發出順序，最舊的在最前面)
+        self._free: list = []
+        self.hits = 0  # 重複使用回收的 sprite
+        self.misses = 0  # 建立新的 sprite
+        self.dropped = 0  # 池滿時提早回收最舊的 (drop_oldest)
+        self.refused = 0  # 池滿時拒絕 (refuse)
+
+    def __len__(self):
+        """目前發出去的數量"""
+        return len(self._live)
+
+    def acquire(self, *args, **kwargs):
+        if not self._free and len(self._live) >= self.capacity:
+            oldest = next(iter(self._live))
+            if not oldest.alive():
+                self.release(oldest)  # 已不在任何群組 (沒有經過 kill)，直接回收
+            elif self.overflow == 'drop_oldest':
+                self.dropped += 1
+                oldest.kill()
+            else:
+                self.refused += 1
+                return None
+
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            sprite = self.create(*args, **kwargs)
+            sprite.pool = self
+            self.misses += 1
+        self._live[sprite] = None
+        return sprite
+
+    def release(self, sprite):
+        """sprite 被 kill() 後呼叫 (重複呼叫無作用)"""
+        if sprite in self._live:
+            del self._live[sprite]
+            self._free.append(sprite)
+
+    def reclaim(self):
+        """把已不在任何群組的 sprite 收回 (例如換關卡清空群組之後)"""
+        for sprite in [sprite for sprite in self._live if not sprite.alive()]:
+            self.release(sprite)
+
+    def stats(self) -> dict:
+        return {
+            'live': len(self._live),
+            'free': len(self._free),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'refused': self.refused,
+        }
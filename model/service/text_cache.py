@@ -0,0 +1,53 @@
+from collections import OrderedDict
+
+import pygame
+
+from configs.settings import TEXT_CACHE_MAX_BYTES, TEXT_CACHE_MAX_ENTRIES
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces, keyed on (font, text, colour, antialias).
+
+    Font.render 對 CJK TTF 很貴，而 HUD / 選單每幀畫的字串幾乎都一樣。
+    同一組參數只會 render 一次；超過筆數或記憶體上限時淘汰最久沒用到的。
+
+    回傳的 Surface 是共用的，呼叫端不可修改 (例如 set_alpha)，需要的話請自行 copy()。
+
+    Usage:
+        surf = TEXT_CACHE.render(fonts.text, f'Kills: {n}', (255, 255, 255))
+    """
+    def __init__(self, max_bytes: int = TEXT_CACHE_MAX_BYTES, max_entries: int = TEXT_CACHE_MAX_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        # 至少保留剛加入的這一筆
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+            _, old = self._entries.popitem(last=False)
+            self.bytes -= old.get_pitch() * old.get_height()
+        return surface
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+
+TEXT_CACHE = TextCache()
@@ -0,0 +1,139 @@
+import numpy as np
+import pygame
+
+
+class TileGrid:
+    """Occupancy grid of the 'Level' tile layer: one uint8 of flags per cell (NumPy array, row-major).
+
+    靜態地形的碰撞查詢直接用格子座標查表，不需要每個 tile 一個 Python 物件；
+    移動平台不在這裡 (仍由 collision_sprites / platform_sprites 負責)。
+    地圖範圍外一律視為空格。
+
+    Usage:
+        grid = TileGrid.from_rects(level_rects, 64, cols=tmx_map.width, rows=tmx_map.height)
+        grid.any_solid(bullet.rect)
+        grid.line_clear(enemy.rect.centerx, player.rect.centerx, y)
+    """
+    SOLID = 1
+    ONE_WAY = 2  # 保留給單向平台
+    HAZARD = 4  # 保留給陷阱 / 傷害地形
+
+    def __init__(self, cols: int, rows: int, tile_size: int = 64):
+        self.tile_size = tile_size
+        self.cells = np.zeros((rows, cols), dtype=np.uint8)
+        self._solid_sum: np.ndarray | None = None  # SOLID 格數的二維前綴和 (rows + 1, cols + 1)
+
+    @classmethod
+    def from_rects(cls, rects, tile_size: int, cols: int = 0, rows: int = 0, flags: int = SOLID) -> 'TileGrid':
+        """由 tile rects (像素座標) 建立；cols / rows 為 0 時取剛好涵蓋所有 rect 的大小"""
+        rects = [pygame.Rect(rect) for rect in rects]
+        if rects:
+            cols = max(cols, max(-(-rect.right // tile_size) for rect in rects))
+            rows = max(rows, max(-(-rect.bottom // tile_size) for rect in rects))
+        grid = cls(cols, rows, tile_size)
+        for rect in rects:
+            grid.mark(rect, flags)
+        return grid
+
+    @property
+    def cols(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def rows(self) -> int:
+        return self.cells.shape[0]
+
+    def mark(self, rect: pygame.Rect, flags: int = SOLID):
+        """把 rect 覆蓋到的格子加上 flags (不對齊格子的 rect 會標記所有碰到的格子)"""
+        span = self._span(rect)
+        if span is None:
+            return
+        c0, r0, c1, r1 = span
+        self.cells[r0:r1 + 1, c0:c1 + 1] |= flags
+        self._solid_sum = None
+
+    def _span(self, rect: pygame.Rect) -> tuple[int, int, int, int] | None:
+        """rect 覆蓋的格子範圍 (含端點，已裁切到地圖內)；完全在地圖外或沒有面積時回傳 None"""
+        if rect.width <= 0 or rect.height <= 0:
+            return None
+        size = self.tile_size
+        c0 = max(rect.left // size, 0)
+        r0 = max(rect.top // size, 0)
+        c1 = min((rect.right - 1) // size, self.cols - 1)
+        r1 = min((rect.bottom - 1) // size, self.rows - 1)
+        if c0 > c1 or r0 > r1:
+            return None
+        return c0, r0, c1, r1
+
+    def _sums(self) -> np.ndarray:
+        if self._solid_sum is None:
+            solid = (self.cells & self.SOLID).astype(bool)
+            sums = np.zeros((self.rows + 1, self.cols + 1), dtype=np.int32)
+            sums[1:, 1:] = solid.cumsum(axis=0).cumsum(axis=1)
+            self._solid_sum = sums
+        return self._solid_sum
+
+    # ---- queries ----
+    def solid_at(self, x: float, y: float) -> bool:
+        col, row = int(x // self.tile_size), int(y // self.tile_size)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return False
+        return bool(self.cells[row, col] & self.SOLID)
+
+    def any_solid(self, rect: pygame.Rect) -> bool:
+        """rect 是否碰到任何實心格 (前綴和，O(1) 與 rect 大小無關)"""
+        span = self._span(rect)
+        if span is None:
+            return False
+        c0, r0, c1, r1 = span
+        sums = self._sums()
+        return bool(sums[r1 + 1, c1 + 1] - sums[r0, c1 + 1] - sums[r1 + 1, c0] + sums[r0, c0])
+
+    def overlaps(self, lefts, tops, rights, bottoms) -> np.ndarray:
+        """批次版 any_solid: 傳入 N 個 rect 的邊界 (right / bottom 不含)，回傳長度 N 的 bool 陣列"""
+        size = self.tile_size
+        lefts, tops = np.asarray(lefts), np.asarray(tops)
+        rights, bottoms = np.asarray(rights), np.asarray(bottoms)
+        c0 = np.clip(lefts // size, 0, self.cols)
+        r0 = np.clip(tops // size, 0, self.rows)
+        c1 = np.clip((rights - 1) // size + 1, 0, self.cols)  # 不含
+        r1 = np.clip((bottoms - 1) // size + 1, 0, self.rows)
+        sums = self._sums()
+        count = sums[r1, c1] - sums[r0, c1] - sums[r1, c0] + sums[r0, c0]
+        return (count > 0) & (rights > lefts) & (bottoms > tops) & (c1 > c0) & (r1 > r0)
+
+    def raycast_x(self, x: float, y: float, direction: int, max_distance: float) -> float | None:
+        """從 (x, y) 水平往 direction (+1 右 / -1 左) 射線，回傳到第一個實心格邊緣的距離；
+        max_distance 內沒有擋住 (例如射擊路線暢通) 回傳 None。起點就在實心格內時距離為 0。"""
+        size = self.tile_size
+        row = int(y // size)
+        if not 0 <= row < self.rows or max_distance < 0:
+            return None
+        start = int(x // size)
+        if direction > 0:
+            end = int((x + max_distance) // size)
+            # 起點 / 終點可能在地圖外: 裁切到 [0, cols)，沒有重疊就不會擋到
+            first, last = max(start, 0), min(end, self.cols - 1)
+            if first > last:
+                return None
+            segment = self.cells[row, first:last + 1] & self.SOLID
+            if not segment.any():
+                return None
+            col = first + int(segment.argmax())
+            distance = max(col * size - x, 0.0)
+        else:
+            end = int((x - max_distance) // size)
+            first, last = max(end, 0), min(start, self.cols - 1)
+            if first > last:
+                return None
+            segment = self.cells[row, first:last + 1][::-1] & self.SOLID
+            if not segment.any():
+                return None
+            col = last - int(segment.argmax())
+            distance = max(x - (col + 1) * size, 0.0)
+        return distance if distance <= max_distance else None
+
+    def line_clear(self, x0: float, x1: float, y: float) -> bool:
+        """y 高度上 x0 → x1 之間沒有實心格 (射擊路線檢查)"""
+        direction = 1 if x1 >= x0 else -1
+        return self.raycast_x(x0, y, direction, abs(x1 - x0)) is None
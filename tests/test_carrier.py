@@ -0,0 +1,56 @@
+"""CarrierSystem: 站在移動平台上的敵人跟著平台走，enemy_sprites (SpatialGroup) 的索引也跟著更新。"""
+import os
+import sys
+import unittest
+from pathlib import Path
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from core.level_manager import LevelManager
+from core.systems.carrier import CarrierSystem
+from core.systems.collisions import CollisionSystem
+from model.service.assets import AssetManager
+
+DT = 1 / 60
+
+
+class CarrierTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.lm = LevelManager(AssetManager(), {1: 17})
+        self.lm.build_level(1, lambda *args: None)
+
+    def test_enemy_rides_moving_platform(self):
+        lm = self.lm
+        platform = next(iter(lm.platform_sprites))
+        enemy = next(iter(lm.enemy_sprites))
+        enemy.rect.midbottom = platform.rect.midtop
+        enemy.position.update(enemy.rect.topleft)
+        for group in enemy.groups():
+            if hasattr(group, 'moved'):
+                group.moved(enemy)
+
+        collisions = CollisionSystem(lm)
+        carrier = CarrierSystem(lm)
+        start_top = platform.rect.top
+        for _ in range(120):
+            # 與 LevelScene.update 相同的順序: 平台邊界 → sprite 移動 → 載運
+            collisions.platform_collisions()
+            lm.all_sprites.update(DT)
+            carrier.update()
+            self.assertEqual(enemy.rect.bottom, platform.rect.top)
+
+        self.assertNotEqual(platform.rect.top, start_top)  # 平台真的有移動
+        self.assertIn(enemy, lm.enemy_sprites.query(enemy.rect))  # 空間索引跟上新位置
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Headless determinism: the same seed and the same input give the same simulation, tick for tick.
+
+Gameplay timers read SIM_CLOCK (not the wall clock) and gameplay randomness uses SIM_CLOCK.random,
+so two runs of N ticks must produce identical state hashes no matter how fast the machine is.
+
+Run: python -m unittest discover tests  (或 python -m pytest tests)
+"""
+import hashlib
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from core.audio import AudioManager
+from core.game_app import GameApp
+from model.service.sim_clock import SIM_CLOCK
+
+TICKS = 2400  # 這段腳本輸入會擊殺敵人並觸發掉落
+
+
+class _Keys:
+    def __init__(self, down):
+        self.down = down
+
+    def __getitem__(self, key):
+        return key in self.down
+
+
+def scripted_keys(tick: int) -> _Keys:
+    """左右來回移動、定時跳躍與射擊"""
+    down = set()
+    phase = (tick // 120) % 4
+    if phase in (0, 1):
+        down.add(pygame.K_RIGHT)
+    if phase == 2:
+        down.add(pygame.K_LEFT)
+    if tick % 50 < 3:
+        down.add(pygame.K_UP)
+    if tick % 7 == 0:
+        down.add(pygame.K_SPACE)
+    if phase == 3 and tick % 30 < 10:
+        down.add(pygame.K_DOWN)
+    return _Keys(down)
+
+
+def _silent_audio(self, assets, music_file, volume):
+    self.assets = assets
+    self.music = None  # 無頭測試不需要背景音樂 (音樂檔不在版本庫中)
+
+
+def run_headless(seed: int, ticks: int = TICKS) -> tuple[str, int, int]:
+    """固定 seed 跑 ticks 個 tick (不限速、不繪製)，回傳 (狀態 hash, 擊殺數, 出現過的道具數)"""
+    SIM_CLOCK.seed = seed
+    tick = 0
+    with mock.patch.object(AudioManager, '__init__', _silent_audio), \
+            mock.patch('pygame.key.get_pressed', lambda: scripted_keys(tick)):
+        app = GameApp()
+        app.change_scene('level')
+        lm = app.level_manager
+        digest = hashlib.md5()
+        items_seen = set()
+        for tick in range(ticks):
+            app.step(app.sim_dt)
+            player = lm.player
+            items_seen.update(lm.item_sprites)
+            state = (
+                tick, SIM_CLOCK.ticks, tuple(player.rect), player.health, player.kill_count,
+                sorted((tuple(enemy.rect), enemy.health) for enemy in lm.enemy_sprites),
+                sorted(tuple(item.rect) for item in lm.item_sprites),
+                len(lm.bullet_sprites),
+            )
+            digest.update(repr(state).encode())
+        kills = lm.player.kill_count
+        app.change_scene('menu')  # 取消這一局的事件訂閱
+    return digest.hexdigest(), kills, len(items_seen)
+
+
+class DeterminismTest(unittest.TestCase):
+    def tearDown(self):
+        SIM_CLOCK.seed = None
+
+    def test_same_seed_same_run(self):
+        first, kills, items = run_headless(seed=1)
+        second, _, _ = run_headless(seed=1)
+        self.assertGreater(kills, 0)
+        self.assertGreater(items, 0)  # 有掉落，亂數也在比對範圍內
+        self.assertEqual(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
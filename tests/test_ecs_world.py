@@ -0,0 +1,60 @@
+"""ECS World: 移除的 entity id 在 flush 之後重用，持續生成 / 移除時 id 表維持固定大小。"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from model.ecs.systems import HealthSystem
+from model.ecs.world import World
+
+
+class WorldIdTest(unittest.TestCase):
+    def setUp(self):
+        self.world = World()
+        self.world.systems = [HealthSystem()]
+
+    def test_sustained_spawn_reaches_steady_state(self):
+        world = self.world
+        for _ in range(500):
+            world.spawn_many(100, position=(0, 0), health=0)  # 下一個 step 就被 HealthSystem 移除
+            world.spawn(position=(0, 0), health=0)
+            world.step(1 / 60)
+        self.assertEqual(len(world), 0)
+        self.assertEqual(world._next_id, 101)
+        self.assertEqual(len(world._row), 128)
+
+    def test_reused_id_points_at_new_entity(self):
+        world = self.world
+        old = world.spawn(position=(1, 2))
+        world.destroy(old)
+        world.flush()
+        self.assertNotIn(old, world)
+        new = world.spawn(position=(3, 4))
+        self.assertEqual(new, old)
+        np.testing.assert_array_equal(world.get(new, 'position'), (3, 4))
+
+    def test_pending_destroy_does_not_hit_reused_id(self):
+        world = self.world
+        old = world.spawn(position=(0, 0), health=1)
+        world.destroy(old)
+        world.set(old, 'health', 0)
+        world.systems[0].update(world, 1 / 60)  # 同一個 step 內被 system 移除...
+        new = world.spawn(position=(0, 0), health=1)  # ...再建立的實體不會拿到同一個 id
+        self.assertNotEqual(new, old)
+        world.flush()
+        self.assertIn(new, world)
+        self.assertEqual(world.spawn(position=(0, 0)), old)  # flush 之後才回收
+
+    def test_clear_restarts_ids(self):
+        world = self.world
+        world.spawn_many(10, position=(0, 0))
+        world.clear()
+        self.assertEqual(int(world.spawn_many(3, position=(0, 0))[0]), 0)
+        self.assertEqual(len(world), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
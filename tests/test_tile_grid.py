@@ -0,0 +1,54 @@
+"""TileGrid 查詢: 水平射線 / 射擊路線，特別是起點或終點在地圖外的情況。"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from model.service.tile_grid import TileGrid
+
+SIZE = 64
+
+
+def grid_with_solid(col: int, row: int = 0, cols: int = 10, rows: int = 1) -> TileGrid:
+    grid = TileGrid(cols, rows, SIZE)
+    grid.cells[row, col] = TileGrid.SOLID
+    return grid
+
+
+class RaycastTest(unittest.TestCase):
+    def setUp(self):
+        self.grid = grid_with_solid(5)  # 實心格 x = 320 ~ 384
+
+    def test_hits_solid_cell(self):
+        self.assertEqual(self.grid.raycast_x(100, 10, 1, 600), 220)
+        self.assertEqual(self.grid.raycast_x(600, 10, -1, 600), 216)
+        self.assertIsNone(self.grid.raycast_x(100, 10, 1, 200))  # 射程不夠
+
+    def test_left_ray_ending_off_grid(self):
+        self.assertIsNone(self.grid.raycast_x(-100, 10, -1, 300))
+        self.assertIsNone(self.grid.raycast_x(100, 10, -1, 500))  # 起點在實心格左邊
+        self.assertTrue(self.grid.line_clear(-100, -400, 10))
+
+    def test_right_ray_starting_off_grid(self):
+        self.assertEqual(self.grid.raycast_x(-100, 10, 1, 1000), 420)
+        self.assertIsNone(self.grid.raycast_x(-500, 10, 1, 300))  # 整段在地圖左邊外
+        self.assertIsNone(self.grid.raycast_x(700, 10, 1, 300))  # 整段在地圖右邊外
+
+    def test_left_ray_starting_off_grid(self):
+        self.assertEqual(self.grid.raycast_x(1000, 10, -1, 1000), 616)
+        self.assertIsNone(self.grid.raycast_x(1000, 10, -1, 200))  # 還沒進到地圖
+
+    def test_row_off_grid(self):
+        self.assertIsNone(self.grid.raycast_x(100, -10, 1, 600))
+        self.assertIsNone(self.grid.raycast_x(100, 70, 1, 600))
+
+    def test_line_clear(self):
+        self.assertFalse(self.grid.line_clear(100, 500, 10))
+        self.assertFalse(self.grid.line_clear(500, 100, 10))
+        self.assertTrue(self.grid.line_clear(100, 300, 10))
+        self.assertTrue(self.grid.line_clear(800, 400, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,16 @@
 import pygame
-from configs.settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from model.service.text_cache import TEXT_CACHE
 
 class HUD:
     def __init__(self, fonts):
         self.fonts = fonts
         self.level_announce_duration = 2.0
         self.level_announce_timer = 0.0
+        # 重複使用的背景 / 文字 surface (尺寸或內容改變才重建)
+        self._kill_bg: pygame.Surface | None = None
+        self._announce_box: pygame.Surface | None = None
+        self._announce_text: pygame.Surface | None = None
+        self._announce_level: int | None = None
 
     def start_level_announce(self):
         self.level_announce_timer = self.level_announce_duration
@@ -13,10 +18,12 @@ class HUD:
     def draw_kill_count(self, surface, level: int, player):
         if not player:
             return
-        text_surf = self.fonts.text.render(f'Level: {level}  Kills: {player.kill_count}', True, (255, 255, 255))
-        bg = pygame.Surface((text_surf.get_width() + 12, text_surf.get_height() + 8), pygame.SRCALPHA)
-        bg.fill((0, 0, 0, 120))
-        surface.blit(bg, (8, 8))
+        text_surf = TEXT_CACHE.render(self.fonts.text, f'Level: {level}  Kills: {player.kill_count}', (255, 255, 255))
+        size = (text_surf.get_width() + 12, text_surf.get_height() + 8)
+        if self._kill_bg is None or self._kill_bg.get_size() != size:
+            self._kill_bg = pygame.Surface(size, pygame.SRCALPHA)
+            self._kill_bg.fill((0, 0, 0, 120))
+        surface.blit(self._kill_bg, (8, 8))
         surface.blit(text_surf, (14, 12))
 
     def draw_level_announce(self, surface, level: int, dt: float):
@@ -25,13 +32,17 @@ class HUD:
         self.level_announce_timer -= dt
         ratio = max(0, self.level_announce_timer / self.level_announce_duration)
         alpha = int(255 * ratio)
-        text_surf = self.fonts.level.render(f'Level {level}', True, (255, 255, 255))
-        padding = 40
-        box = pygame.Surface((text_surf.get_width() + padding, text_surf.get_height() + padding), pygame.SRCALPHA)
+        if self._announce_text is None or self._announce_level != level:
+            # 快取中的 surface 是共用的，淡出要改 alpha，所以每個關卡只 copy 一次
+            self._announce_text = TEXT_CACHE.render(self.fonts.level, f'Level {level}', (255, 255, 255)).copy()
+            self._announce_level = level
+            padding = 40
+            self._announce_box = pygame.Surface(
+                (self._announce_text.get_width() + padding, self._announce_text.get_height() + padding), pygame.SRCALPHA)
+        box = self._announce_box
         box.fill((0, 0, 0, int(160 * ratio)))
-        box_rect = box.get_rect(center=(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2))
-        text_rect = text_surf.get_rect(center=box_rect.center)
-        tmp = text_surf.copy()
-        tmp.set_alpha(alpha)
+        box_rect = box.get_rect(center=surface.get_rect().center)
+        text_rect = self._announce_text.get_rect(center=box_rect.center)
+        self._announce_text.set_alpha(alpha)
         surface.blit(box, box_rect)
-        surface.blit(tmp, text_rect)
+        surface.blit(self._announce_text, text_rect)